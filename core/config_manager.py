@@ -3,15 +3,52 @@ Configuration and profile management
 """
 
 import json
+import logging
 import os
+import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 import time
 import shutil
 
 from models.profile import Profile, WindowProfile
 from utils.platform_utils import get_app_data_dir
 
+# Optional: orjson is a much faster JSON encoder/decoder; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+# Buffer size for config file I/O (files are read/written in a single call)
+IO_BUFFER_SIZE = 64 * 1024
+
+# Each profile's backups are appended to "<profile>.jsonl", one backup per line.
+# Full backups (and backups from older versions) are standalone ".json" files.
+BACKUP_LOG_SUFFIX = '.jsonl'
+BACKUP_SUFFIXES = ('.json', BACKUP_LOG_SUFFIX)
+
+# Per-profile backups written by older versions: "<profile>_<YYYYmmdd_HHMMSS>.json"
+_LEGACY_BACKUP_RE = re.compile(r'(.+)_\d{8}_\d{6}\.json')
+_FULL_BACKUP_PREFIX = 'full_backup_'
+
+# Directories already created by this process
+_ensured_dirs: Set[str] = set()
+
+
+def _ensure_dir(path: Path):
+    """Create a directory (and its parents) at most once per process"""
+    key = str(path)
+    if key in _ensured_dirs:
+        return
+    
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(key)
+
 
 class ConfigManager:
     """Handles saving and loading of profiles and application settings"""
@@ -22,9 +59,8 @@ class ConfigManager:
         self.settings_file = self.config_dir / "settings.json"
         self.backup_dir = self.config_dir / "backups"
         
-        # Ensure directories exist
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure directories exist (backup_dir lives inside config_dir)
+        _ensure_dir(self.backup_dir)
         
         # Default settings
         self.default_settings = {
@@ -36,24 +72,54 @@ class ConfigManager:
             'auto_refresh_interval': 5,  # seconds
             'show_tooltips': True,
             'confirm_deletions': True,
-            'debug_mode': False
+            'debug_mode': False,
+            'durable_writes': True  # fsync profiles.json before replacing it
         }
+        
+        # In-memory caches, invalidated by the file's (mtime_ns, size) stamp
+        self._profiles_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._profiles_stamp: Optional[Tuple[int, int]] = None
+        self._profiles_validated = False
+        self._settings_cache: Optional[Dict[str, Any]] = None
+        self._settings_stamp: Optional[Tuple[int, int]] = None
+        
+        # Batched writes (see batch())
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._batch_timestamps: Dict[str, str] = {}
+        
+        # Backup log appends since each log was last trimmed
+        self._backup_appends: Dict[str, int] = {}
     
     # ===============================================================================
     # PROFILE MANAGEMENT
     # ===============================================================================
     
+    @contextmanager
+    def batch(self):
+        """Group profile changes so profiles.json is written only once on exit"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._batch_timestamps.clear()
+                if self._batch_dirty:
+                    self._batch_dirty = False
+                    self._write_profiles(self._profiles_cache)
+    
     def save_profile(self, profile: Profile) -> bool:
         """Save a profile to disk"""
         try:
             # Validate profile
             errors = profile.validate()
             if errors:
-                print(f"❌ Profile validation failed: {', '.join(errors)}")
+                logger.error("❌ Profile validation failed: %s", ', '.join(errors))
                 return False
             
             # Load existing profiles
-            profiles = self.load_profiles()
+            profiles = dict(self.load_profiles_raw())
             
             # Backup if profile already exists
             if profile.name in profiles and self.get_setting('backup_profiles', True):
@@ -63,52 +129,97 @@ class ConfigManager:
             profiles[profile.name] = profile.to_dict()
             
             # Write to file
-            self._write_profiles(profiles)
+            self._store_profiles(profiles)
             
-            print(f"✅ Profile '{profile.name}' saved successfully")
+            logger.info("✅ Profile '%s' saved successfully", profile.name)
             return True
             
-        except Exception as e:
-            print(f"❌ Failed to save profile '{profile.name}': {e}")
+        except Exception:
+            logger.exception("❌ Failed to save profile '%s'", profile.name)
             return False
     
     def load_profiles(self) -> Dict[str, Dict[str, Any]]:
-        """Load all profiles from disk"""
-        if not self.profiles_file.exists():
+        """Load all profiles, validated and migrated to the current format"""
+        profiles = self.load_profiles_raw()
+        
+        # Missing file or data restored from a backup: nothing cached to reuse
+        if profiles is not self._profiles_cache:
+            return self._validate_and_migrate_profiles(profiles)
+        
+        # Validation runs once per read from disk, not on every cache hit
+        if not self._profiles_validated:
+            self._profiles_cache = self._validate_and_migrate_profiles(profiles)
+            self._profiles_validated = True
+        
+        return dict(self._profiles_cache)
+    
+    def load_profiles_raw(self) -> Dict[str, Dict[str, Any]]:
+        """Get the shared profiles dict as stored on disk (read-only, not validated or migrated)"""
+        # Inside a batch the in-memory copy is authoritative
+        if self._batch_depth and self._profiles_cache is not None:
+            return self._profiles_cache
+        
+        stamp = self._file_stamp(self.profiles_file)
+        if stamp is None:
+            self._profiles_cache = None
+            self._profiles_stamp = None
             return {}
         
+        if self._profiles_cache is not None and stamp == self._profiles_stamp:
+            return self._profiles_cache
+        
         try:
-            with open(self.profiles_file, 'r', encoding='utf-8') as f:
-                profiles = json.load(f)
+            profiles = self._read_json(self.profiles_file)
+            if not isinstance(profiles, dict):
+                raise ValueError("profiles file does not contain a JSON object")
             
-            # Validate and migrate if needed
-            return self._validate_and_migrate_profiles(profiles)
+            self._profiles_cache = profiles
+            self._profiles_stamp = stamp
+            self._profiles_validated = False
+            return profiles
             
         except (json.JSONDecodeError, FileNotFoundError) as e:
-            print(f"❌ Failed to load profiles: {e}")
+            logger.error("❌ Failed to load profiles: %s", e)
             # Try to restore from backup
             return self._restore_from_backup()
-        except Exception as e:
-            print(f"❌ Unexpected error loading profiles: {e}")
+        except Exception:
+            logger.exception("❌ Unexpected error loading profiles")
             return {}
     
+    def validate_all(self) -> bool:
+        """Validate and migrate every stored profile and write the result back to disk"""
+        try:
+            profiles = self.load_profiles_raw()
+            if not profiles:
+                return True
+            
+            self._store_profiles(self._validate_and_migrate_profiles(profiles))
+            self._profiles_validated = True
+            
+            return True
+            
+        except Exception:
+            logger.exception("❌ Failed to validate profiles")
+            return False
+    
     def load_profile(self, profile_name: str) -> Optional[Profile]:
         """Load a specific profile by name"""
-        profiles = self.load_profiles()
+        profiles = self.load_profiles_raw()
         
         if profile_name not in profiles:
             return None
         
+        # Only the requested profile is validated
         try:
             return Profile.from_dict(profiles[profile_name])
         except Exception as e:
-            print(f"❌ Failed to load profile '{profile_name}': {e}")
+            logger.error("❌ Failed to load profile '%s': %s", profile_name, e)
             return None
     
     def delete_profile(self, profile_name: str) -> bool:
         """Delete a profile"""
         try:
-            profiles = self.load_profiles()
+            profiles = dict(self.load_profiles_raw())
             
             if profile_name not in profiles:
                 return False
@@ -121,13 +232,13 @@ class ConfigManager:
             del profiles[profile_name]
             
             # Write updated profiles
-            self._write_profiles(profiles)
+            self._store_profiles(profiles)
             
-            print(f"✅ Profile '{profile_name}' deleted successfully")
+            logger.info("✅ Profile '%s' deleted successfully", profile_name)
             return True
             
-        except Exception as e:
-            print(f"❌ Failed to delete profile '{profile_name}': {e}")
+        except Exception:
+            logger.exception("❌ Failed to delete profile '%s'", profile_name)
             return False
     
     def rename_profile(self, old_name: str, new_name: str) -> bool:
@@ -136,71 +247,65 @@ class ConfigManager:
             return True
         
         try:
-            profiles = self.load_profiles()
+            profiles = dict(self.load_profiles_raw())
             
             if old_name not in profiles:
                 return False
             
             if new_name in profiles:
-                print(f"❌ Profile '{new_name}' already exists")
+                logger.error("❌ Profile '%s' already exists", new_name)
                 return False
             
-            # Copy profile with new name
-            profile_data = profiles[old_name].copy()
-            profile_data['name'] = new_name
-            profiles[new_name] = profile_data
-            
-            # Remove old profile
-            del profiles[old_name]
+            # Move profile to the new key; nested data is shared, not copied, and
+            # the cached entry itself is left untouched
+            profiles[new_name] = {**profiles.pop(old_name), 'name': new_name}
             
             # Write updated profiles
-            self._write_profiles(profiles)
+            self._store_profiles(profiles)
             
-            print(f"✅ Profile renamed from '{old_name}' to '{new_name}'")
+            logger.info("✅ Profile renamed from '%s' to '%s'", old_name, new_name)
             return True
             
-        except Exception as e:
-            print(f"❌ Failed to rename profile: {e}")
+        except Exception:
+            logger.exception("❌ Failed to rename profile '%s'", old_name)
             return False
     
     def duplicate_profile(self, source_name: str, new_name: str) -> bool:
         """Duplicate a profile with a new name"""
         try:
-            profiles = self.load_profiles()
+            profiles = dict(self.load_profiles_raw())
             
             if source_name not in profiles:
                 return False
             
             if new_name in profiles:
-                print(f"❌ Profile '{new_name}' already exists")
+                logger.error("❌ Profile '%s' already exists", new_name)
                 return False
             
-            # Copy profile data
-            profile_data = profiles[source_name].copy()
-            profile_data['name'] = new_name
-            profile_data['created_at'] = time.strftime("%Y-%m-%d %H:%M:%S")
-            
-            profiles[new_name] = profile_data
+            # Copy profile data (nested window data is shared, it is only ever serialized)
+            profiles[new_name] = {
+                **profiles[source_name],
+                'name': new_name,
+                'created_at': self._timestamp("%Y-%m-%d %H:%M:%S")
+            }
             
             # Write updated profiles
-            self._write_profiles(profiles)
+            self._store_profiles(profiles)
             
-            print(f"✅ Profile duplicated: '{source_name}' -> '{new_name}'")
+            logger.info("✅ Profile duplicated: '%s' -> '%s'", source_name, new_name)
             return True
             
-        except Exception as e:
-            print(f"❌ Failed to duplicate profile: {e}")
+        except Exception:
+            logger.exception("❌ Failed to duplicate profile '%s'", source_name)
             return False
     
     def get_profile_names(self) -> List[str]:
         """Get list of all profile names"""
-        profiles = self.load_profiles()
-        return sorted(profiles.keys())
+        return sorted(self.load_profiles_raw().keys())
     
     def profile_exists(self, profile_name: str) -> bool:
         """Check if a profile exists"""
-        profiles = self.load_profiles()
-        return profile_name in profiles
+        return profile_name in self.load_profiles_raw()
     
     # ===============================================================================
     # SETTINGS MANAGEMENT
@@ -210,40 +315,58 @@ class ConfigManager:
         """Save application settings"""
         try:
             # Merge with existing settings
-            current_settings = self.load_settings()
-            current_settings.update(settings)
+            cached_settings = self._get_cached_settings()
+            current_settings = {**cached_settings, **settings}
+            
+            # Nothing changed (e.g. the same geometry saved again): skip the write
+            if current_settings == cached_settings:
+                return True
             
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(current_settings, f, indent=2, ensure_ascii=False)
+            self._write_json(self.settings_file, current_settings)
+            
+            # Keep the cache in sync without re-reading what we just wrote
+            self._settings_cache = current_settings
+            self._settings_stamp = self._file_stamp(self.settings_file)
             
             return True
             
-        except Exception as e:
-            print(f"❌ Failed to save settings: {e}")
+        except Exception:
+            logger.exception("❌ Failed to save settings")
             return False
     
     def load_settings(self) -> Dict[str, Any]:
         """Load application settings"""
-        if not self.settings_file.exists():
-            return self.default_settings.copy()
+        return self._get_cached_settings().copy()
+    
+    def _get_cached_settings(self) -> Dict[str, Any]:
+        """Get the shared (read-only) settings dict, re-reading only when the file changed"""
+        stamp = self._file_stamp(self.settings_file)
+        if stamp is None:
+            self._settings_cache = None
+            self._settings_stamp = None
+            return self.default_settings
+        
+        if self._settings_cache is not None and stamp == self._settings_stamp:
+            return self._settings_cache
         
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+            settings = self._read_json(self.settings_file)
             
             # Merge with defaults to ensure all keys exist
             result = self.default_settings.copy()
             result.update(settings)
+            
+            self._settings_cache = result
+            self._settings_stamp = stamp
             return result
             
         except Exception as e:
-            print(f"❌ Failed to load settings: {e}")
-            return self.default_settings.copy()
+            logger.error("❌ Failed to load settings: %s", e)
+            return self.default_settings
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a specific setting value"""
-        settings = self.load_settings()
-        return settings.get(key, default)
+        return self._get_cached_settings().get(key, default)
     
     def set_setting(self, key: str, value: Any) -> bool:
         """Set a specific setting value"""
@@ -254,61 +377,123 @@ class ConfigManager:
     # ===============================================================================
     
     def _backup_profile(self, profile_name: str, profile_data: Dict[str, Any]):
-        """Create a backup of a profile"""
+        """Append a backup of a profile to its rolling backup log"""
         try:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            backup_file = self.backup_dir / f"{profile_name}_{timestamp}.json"
+            # Keeping no backups: drop any existing log instead of appending to it
+            max_backups = self.get_setting('max_backups', 10)
+            if max_backups <= 0:
+                self._cleanup_old_backups(profile_name)
+                return
             
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump({profile_name: profile_data}, f, indent=2, ensure_ascii=False)
+            entry = {'ts': self._timestamp("%Y-%m-%d %H:%M:%S"), 'data': profile_data}
             
-            # Clean up old backups
-            self._cleanup_old_backups(profile_name)
+            # One JSON document per line; compact JSON never contains raw newlines
+            with open(self._backup_log_path(profile_name), 'ab', buffering=IO_BUFFER_SIZE) as f:
+                f.write(self._encode_json(entry) + b'\n')
+            
+            # Trim the log every max_backups appends (and on the first append of
+            # this process, since earlier runs may have left it long)
+            appends = self._backup_appends.get(profile_name, max_backups) + 1
+            if appends >= max_backups:
+                self._cleanup_old_backups(profile_name)
+                appends = 0
+            self._backup_appends[profile_name] = appends
             
         except Exception as e:
-            print(f"⚠️ Failed to backup profile '{profile_name}': {e}")
+            logger.warning("⚠️ Failed to backup profile '%s': %s", profile_name, e)
+    
+    def _backup_log_path(self, profile_name: str) -> Path:
+        """Get the rolling backup log for a profile"""
+        return self.backup_dir / f"{profile_name}{BACKUP_LOG_SUFFIX}"
     
     def _cleanup_old_backups(self, profile_name: str):
-        """Remove old backup files, keeping only the most recent ones"""
+        """Truncate a profile's backup log to the most recent max_backups entries"""
         try:
             max_backups = self.get_setting('max_backups', 10)
-            pattern = f"{profile_name}_*.json"
+            log_path = self._backup_log_path(profile_name)
             
-            # Get all backup files for this profile
-            backup_files = list(self.backup_dir.glob(pattern))
-            backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+            if max_backups <= 0:
+                log_path.unlink()
+                return
             
-            # Remove excess backups
-            for backup_file in backup_files[max_backups:]:
-                backup_file.unlink()
-                
+            with open(log_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                lines = [line for line in f.read().split(b'\n') if line]
+            
+            if len(lines) <= max_backups:
+                return
+            
+            # Rewrite atomically with only the newest entries
+            temp_file = log_path.with_suffix('.tmp')
+            with open(temp_file, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                f.write(b'\n'.join(lines[len(lines) - max_backups:]) + b'\n')
+            os.replace(temp_file, log_path)
+            
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"⚠️ Failed to cleanup backups: {e}")
+            logger.warning("⚠️ Failed to cleanup backups: %s", e)
+    
+    def _cleanup_legacy_backups(self, legacy_backups: Dict[str, List[os.DirEntry]],
+                                logged_profiles: Set[str]):
+        """Remove old-style backup files superseded by a log or beyond max_backups"""
+        max_backups = max(self.get_setting('max_backups', 10), 0)
+        removed = 0
+        
+        for profile_name, entries in legacy_backups.items():
+            # Profiles with a backup log no longer need their old files at all
+            keep = 0 if profile_name in logged_profiles else max_backups
+            entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+            for entry in entries[keep:]:
+                try:
+                    os.unlink(entry.path)
+                    removed += 1
+                except OSError as e:
+                    logger.warning("⚠️ Failed to remove old backup '%s': %s", entry.name, e)
+        
+        if removed:
+            logger.info("🧹 Removed %d old-style backup file(s)", removed)
     
     def _restore_from_backup(self) -> Dict[str, Dict[str, Any]]:
         """Attempt to restore profiles from backup"""
         try:
-            backup_files = list(self.backup_dir.glob("*.json"))
-            if not backup_files:
+            # Find the most recent backup in a single directory pass
+            latest_backup = None
+            latest_mtime = -1.0
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(BACKUP_SUFFIXES) or not entry.is_file():
+                        continue
+                    mtime = entry.stat().st_mtime
+                    if mtime > latest_mtime:
+                        latest_backup, latest_mtime = entry, mtime
+            
+            if latest_backup is None:
                 return {}
             
-            # Use the most recent backup
-            latest_backup = max(backup_files, key=lambda f: f.stat().st_mtime)
-            
-            with open(latest_backup, 'r', encoding='utf-8') as f:
-                backup_data = json.load(f)
+            if latest_backup.name.endswith(BACKUP_LOG_SUFFIX):
+                # Rolling log: the last line holds the newest backup of one profile
+                with open(latest_backup.path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                    last_line = f.read().rstrip(b'\n').rsplit(b'\n', 1)[-1]
+                profile_name = latest_backup.name[:-len(BACKUP_LOG_SUFFIX)]
+                backup_data = {profile_name: self._decode_json(last_line)['data']}
+            else:
+                backup_data = self._read_json(latest_backup.path)
+                
+                # Full backups wrap the profiles together with settings
+                if 'profiles' in backup_data and 'backup_time' in backup_data:
+                    backup_data = backup_data['profiles']
             
-            print(f"🔄 Restored profiles from backup: {latest_backup.name}")
+            logger.info("🔄 Restored profiles from backup: %s", latest_backup.name)
             return backup_data
             
         except Exception as e:
-            print(f"❌ Failed to restore from backup: {e}")
+            logger.error("❌ Failed to restore from backup: %s", e)
             return {}
     
     def create_full_backup(self) -> bool:
         """Create a full backup of all profiles and settings"""
         try:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            timestamp = self._timestamp("%Y%m%d_%H%M%S")
             backup_file = self.backup_dir / f"full_backup_{timestamp}.json"
             
             backup_data = {
@@ -318,14 +503,13 @@ class ConfigManager:
                 'version': '1.0'
             }
             
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False)
+            self._write_json(backup_file, backup_data, pretty=True)
             
-            print(f"✅ Full backup created: {backup_file.name}")
+            logger.info("✅ Full backup created: %s", backup_file.name)
             return True
             
-        except Exception as e:
-            print(f"❌ Failed to create full backup: {e}")
+        except Exception:
+            logger.exception("❌ Failed to create full backup")
             return False
     
     # ===============================================================================
@@ -341,37 +525,36 @@ class ConfigManager:
             
             export_data = {
                 'profile': profile.to_dict(),
-                'export_time': time.strftime("%Y-%m-%d %H:%M:%S"),
+                'export_time': self._timestamp("%Y-%m-%d %H:%M:%S"),
                 'version': '1.0'
             }
             
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            self._write_json(export_path, export_data, pretty=True)
             
             return True
             
-        except Exception as e:
-            print(f"❌ Failed to export profile: {e}")
+        except Exception:
+            logger.exception("❌ Failed to export profile '%s'", profile_name)
             return False
     
     def import_profile(self, import_path: Path, overwrite: bool = False) -> Optional[str]:
         """Import a profile from a file"""
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            import_data = self._read_json(import_path)
             
             if 'profile' not in import_data:
-                print("❌ Invalid profile file format")
+                logger.error("❌ Invalid profile file format")
                 return None
             
             profile = Profile.from_dict(import_data['profile'])
             
             # Check if profile already exists
-            if self.profile_exists(profile.name) and not overwrite:
-                # Generate unique name
+            existing_names = self.load_profiles_raw()
+            if profile.name in existing_names and not overwrite:
+                # Generate unique name from a single snapshot of the names
                 base_name = profile.name
                 counter = 1
-                while self.profile_exists(f"{base_name}_{counter}"):
+                while f"{base_name}_{counter}" in existing_names:
                     counter += 1
                 profile.name = f"{base_name}_{counter}"
             
@@ -381,25 +564,49 @@ class ConfigManager:
             
             return None
             
-        except Exception as e:
-            print(f"❌ Failed to import profile: {e}")
+        except Exception:
+            logger.exception("❌ Failed to import profile from %s", import_path)
             return None
     
     # ===============================================================================
     # UTILITY METHODS
     # ===============================================================================
     
+    def _store_profiles(self, profiles: Dict[str, Dict[str, Any]]):
+        """Write profiles to disk, or defer the write while a batch is open"""
+        if self._batch_depth:
+            self._profiles_cache = profiles
+            self._batch_dirty = True
+            return
+        
+        self._write_profiles(profiles)
+    
     def _write_profiles(self, profiles: Dict[str, Dict[str, Any]]):
         """Write profiles to disk with error handling"""
         # Create temporary file first
         temp_file = self.profiles_file.with_suffix('.tmp')
         
         try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(profiles, f, indent=2, ensure_ascii=False)
+            data = self._encode_json(profiles)
+            
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                
+                # Make sure the data hits the disk before the rename publishes it
+                if self.get_setting('durable_writes', True):
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
             
             # Atomic move
-            temp_file.replace(self.profiles_file)
+            os.replace(temp_file, self.profiles_file)
+            
+            # Keep the cache in sync without re-reading what we just wrote
+            self._profiles_cache = profiles
+            self._profiles_stamp = self._file_stamp(self.profiles_file)
             
         except Exception as e:
             # Clean up temp file if it exists
@@ -407,6 +614,59 @@ class ConfigManager:
                 temp_file.unlink()
             raise e
     
+    def _timestamp(self, fmt: str) -> str:
+        """Format the current time, reusing a single timestamp per format within a batch"""
+        if not self._batch_depth:
+            return time.strftime(fmt)
+        
+        timestamp = self._batch_timestamps.get(fmt)
+        if timestamp is None:
+            timestamp = self._batch_timestamps[fmt] = time.strftime(fmt)
+        return timestamp
+    
+    @classmethod
+    def _read_json(cls, path: Path) -> Any:
+        """Read and decode a JSON file with a single buffered binary read"""
+        with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            return cls._decode_json(f.read())
+    
+    @staticmethod
+    def _decode_json(data: bytes) -> Any:
+        """Decode UTF-8 JSON bytes"""
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    
+    @staticmethod
+    def _encode_json(data: Any, pretty: bool = False) -> bytes:
+        """Encode data as UTF-8 JSON (compact unless pretty output is requested)"""
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option)
+        
+        if pretty:
+            text = json.dumps(data, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        return text.encode('utf-8')
+    
+    @classmethod
+    def _write_json(cls, path: Path, data: Any, pretty: bool = False):
+        """Encode data as UTF-8 JSON and write it with a single buffered call"""
+        with open(path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            f.write(cls._encode_json(data, pretty))
+    
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+        """Get a cheap change stamp for a file, or None if it doesn't exist"""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
     def _validate_and_migrate_profiles(self, profiles: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Validate and migrate profiles to current format"""
         validated_profiles = {}
@@ -418,7 +678,7 @@ class ConfigManager:
                 validated_profiles[name] = profile.to_dict()
                 
             except Exception as e:
-                print(f"⚠️ Skipping invalid profile '{name}': {e}")
+                logger.warning("⚠️ Skipping invalid profile '%s': %s", name, e)
                 continue
         
         return validated_profiles
@@ -426,31 +686,58 @@ class ConfigManager:
     def get_storage_info(self) -> Dict[str, Any]:
         """Get information about storage usage"""
         try:
+            # Count and size backups in a single directory pass
+            backup_count = 0
+            backup_dir_size = 0
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(BACKUP_SUFFIXES) and entry.is_file():
+                        backup_count += 1
+                        backup_dir_size += entry.stat().st_size
+            
+            profiles_stamp = self._file_stamp(self.profiles_file)
+            settings_stamp = self._file_stamp(self.settings_file)
+            
             info = {
                 'config_dir': str(self.config_dir),
-                'profiles_file_size': self.profiles_file.stat().st_size if self.profiles_file.exists() else 0,
-                'settings_file_size': self.settings_file.stat().st_size if self.settings_file.exists() else 0,
-                'backup_count': len(list(self.backup_dir.glob('*.json'))),
-                'backup_dir_size': sum(f.stat().st_size for f in self.backup_dir.glob('*.json')),
-                'total_profiles': len(self.load_profiles())
+                'profiles_file_size': profiles_stamp[1] if profiles_stamp else 0,
+                'settings_file_size': settings_stamp[1] if settings_stamp else 0,
+                'backup_count': backup_count,
+                'backup_dir_size': backup_dir_size,
+                'total_profiles': len(self.load_profiles_raw())
             }
             
             return info
             
-        except Exception as e:
-            print(f"❌ Failed to get storage info: {e}")
+        except Exception:
+            logger.exception("❌ Failed to get storage info")
             return {}
     
     def cleanup_storage(self) -> bool:
         """Clean up old backups and optimize storage"""
         try:
-            # Clean up all old backups
-            for profile_name in self.get_profile_names():
+            # Find every profile's backup log (including deleted profiles) and any
+            # per-profile backup files left by older versions, in one directory pass
+            profile_names = []
+            legacy_backups: Dict[str, List[os.DirEntry]] = {}
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith(BACKUP_LOG_SUFFIX):
+                        profile_names.append(name[:-len(BACKUP_LOG_SUFFIX)])
+                    elif not name.startswith(_FULL_BACKUP_PREFIX):
+                        match = _LEGACY_BACKUP_RE.fullmatch(name)
+                        if match and entry.is_file():
+                            legacy_backups.setdefault(match.group(1), []).append(entry)
+            
+            for profile_name in profile_names:
                 self._cleanup_old_backups(profile_name)
             
-            print("✅ Storage cleanup completed")
+            self._cleanup_legacy_backups(legacy_backups, set(profile_names))
+            
+            logger.info("✅ Storage cleanup completed")
             return True
             
-        except Exception as e:
-            print(f"❌ Storage cleanup failed: {e}")
+        except Exception:
+            logger.exception("❌ Storage cleanup failed")
             return False
\ No newline at end of file
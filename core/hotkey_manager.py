@@ -2,14 +2,129 @@
 Global hotkey management with multiple fallback methods
 """
 
+import logging
+import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional, List, Set
 from enum import Enum
 
-from models.hotkey import HotkeyConfig
+from models.hotkey import HotkeyConfig, ModifierKey
 from utils.platform_utils import get_windows_api
 
+logger = logging.getLogger(__name__)
+
+
+# Bit flags for pynput key state tracking
+_BIT_CTRL = 1 << 0
+_BIT_ALT = 1 << 1
+_BIT_SHIFT = 1 << 2
+_BIT_WIN = 1 << 3
+_BIT_MAIN = 1 << 4
+
+# Callbacks allowed to be running or queued at once; newer triggers are dropped
+MAX_PENDING_CALLBACKS = 2
+
+_MOUSE_MAIN_KEYS = ('middle', 'mouse4', 'mouse5')
+
+_MODIFIER_BITS = {'ctrl': _BIT_CTRL, 'alt': _BIT_ALT, 'shift': _BIT_SHIFT, 'win': _BIT_WIN}
+
+
+# ===============================================================================
+# KEY TABLES (built once at import time)
+# ===============================================================================
+
+try:
+    from pynput import keyboard as _pynput_keyboard, mouse as _pynput_mouse
+    
+    _F_KEY_MAP = {f'f{i}': getattr(_pynput_keyboard.Key, f'f{i}') for i in range(1, 13)}
+    _SPECIAL_KEY_MAP = {
+        'tab': _pynput_keyboard.Key.tab,
+        'space': _pynput_keyboard.Key.space,
+        'enter': _pynput_keyboard.Key.enter,
+        'escape': _pynput_keyboard.Key.esc,
+        'backspace': _pynput_keyboard.Key.backspace,
+        'delete': _pynput_keyboard.Key.delete,
+        'up': _pynput_keyboard.Key.up,
+        'down': _pynput_keyboard.Key.down,
+        'left': _pynput_keyboard.Key.left,
+        'right': _pynput_keyboard.Key.right
+    }
+    # Side buttons are x1/x2 on win32 and button8/button9 on xorg; darwin has neither
+    _Button = _pynput_mouse.Button
+    _MOUSE_BUTTON_MAP = {
+        name: button for name, button in (
+            ('middle', getattr(_Button, 'middle', None)),
+            ('mouse4', getattr(_Button, 'x1', None) or getattr(_Button, 'button8', None)),
+            ('mouse5', getattr(_Button, 'x2', None) or getattr(_Button, 'button9', None)),
+        ) if button is not None
+    }
+    del _Button
+except ImportError:
+    _F_KEY_MAP = {}
+    _SPECIAL_KEY_MAP = {}
+    _MOUSE_BUTTON_MAP = {}
+
+try:
+    import pywintypes
+    import win32con
+    import win32event
+    import win32gui
+    
+    _SPECIAL_VK_MAP = {
+        'space': win32con.VK_SPACE,
+        'tab': win32con.VK_TAB,
+        'enter': win32con.VK_RETURN,
+        'escape': win32con.VK_ESCAPE,
+        'backspace': win32con.VK_BACK,
+        'delete': win32con.VK_DELETE,
+        'up': win32con.VK_UP,
+        'down': win32con.VK_DOWN,
+        'left': win32con.VK_LEFT,
+        'right': win32con.VK_RIGHT
+    }
+    
+    # MOD_NOREPEAT stops auto-repeat WM_HOTKEY storms
+    _MOD_NOREPEAT = getattr(win32con, 'MOD_NOREPEAT', 0x4000)
+    _MOD_FLAG_MAP = {
+        ModifierKey.CTRL: win32con.MOD_CONTROL,
+        ModifierKey.ALT: win32con.MOD_ALT,
+        ModifierKey.SHIFT: win32con.MOD_SHIFT,
+        ModifierKey.WIN: win32con.MOD_WIN
+    }
+    
+    # Virtual keys pynput reports for each modifier (generic, left and right)
+    _MODIFIER_VKS = {
+        ModifierKey.CTRL: (win32con.VK_CONTROL, win32con.VK_LCONTROL, win32con.VK_RCONTROL),
+        ModifierKey.ALT: (win32con.VK_MENU, win32con.VK_LMENU, win32con.VK_RMENU),
+        ModifierKey.SHIFT: (win32con.VK_SHIFT, win32con.VK_LSHIFT, win32con.VK_RSHIFT),
+        ModifierKey.WIN: (win32con.VK_LWIN, win32con.VK_RWIN)
+    }
+    
+    # Low-level mouse messages for each mouse main key
+    _MOUSE_BUTTON_MSGS = {
+        'middle': frozenset((win32con.WM_MBUTTONDOWN, win32con.WM_MBUTTONUP)),
+        'mouse4': frozenset((getattr(win32con, 'WM_XBUTTONDOWN', 0x020B), getattr(win32con, 'WM_XBUTTONUP', 0x020C))),
+        'mouse5': frozenset((getattr(win32con, 'WM_XBUTTONDOWN', 0x020B), getattr(win32con, 'WM_XBUTTONUP', 0x020C)))
+    }
+    
+    # Every main key RegisterHotKey can take (mouse buttons are not supported)
+    _VK_CODE_TABLE = {
+        **_SPECIAL_VK_MAP,
+        **{f'f{i}': win32con.VK_F1 + i - 1 for i in range(1, 13)},
+        **{c: ord(c.upper()) for c in 'abcdefghijklmnopqrstuvwxyz'},
+        **{d: ord(d) for d in '0123456789'}
+    }
+except ImportError:
+    pywintypes = win32con = win32event = win32gui = None
+    _SPECIAL_VK_MAP = {}
+    _MOD_NOREPEAT = 0
+    _MOD_FLAG_MAP = {}
+    _MODIFIER_VKS = {}
+    _MOUSE_BUTTON_MSGS = {}
+    _VK_CODE_TABLE = {}
+
 
 class HotkeyMethod(Enum):
     """Available hotkey detection methods"""
@@ -24,9 +139,12 @@ class HotkeyManager:
     def __init__(self):
         self.current_config: Optional[HotkeyConfig] = None
         self.callback: Optional[Callable] = None
+        self._kb_string = ''
+        self._has_mouse_component = False
         self.is_listening = False
-        self.last_trigger_time = 0
-        self.min_trigger_interval = 0.2  # 200ms debounce
+        self._last_trigger_ns = 0
+        self._trigger_lock = threading.Lock()
+        self.min_trigger_interval_ns = 200_000_000  # 200ms debounce
         
         # Method management
         self.active_method: Optional[HotkeyMethod] = None
@@ -35,6 +153,12 @@ class HotkeyManager:
         # Threading
         self.hotkey_thread: Optional[threading.Thread] = None
         self.stop_thread = False
+        self._stop_event = None  # Win32 event handle that wakes the hotkey thread
+        
+        # Single long-lived worker that runs callbacks in trigger order, with a
+        # bounded backlog so auto-repeat storms cannot pile up activations
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending_slots = threading.BoundedSemaphore(MAX_PENDING_CALLBACKS)
         
         # Method-specific attributes
         self._init_keyboard_lib()
@@ -53,6 +177,9 @@ class HotkeyManager:
     
     def _init_pynput(self):
         """Initialize pynput libraries"""
+        self.key_listener = None
+        self.mouse_listener = None
+        
         try:
             import pynput.keyboard as pynput_keyboard
             import pynput.mouse as pynput_mouse
@@ -60,12 +187,20 @@ class HotkeyManager:
             self.pynput_mouse = pynput_mouse
             self.pynput_available = True
             
-            # Pynput state tracking
-            self.pressed_keys: Set = set()
-            self.pressed_mouse: Set = set()
+            # Pynput state tracking: one bit per modifier plus one for the main key
+            Key = pynput_keyboard.Key
+            self._modifier_key_bits = {
+                Key.ctrl: _BIT_CTRL, Key.ctrl_l: _BIT_CTRL, Key.ctrl_r: _BIT_CTRL,
+                Key.alt: _BIT_ALT, Key.alt_l: _BIT_ALT, Key.alt_r: _BIT_ALT,
+                Key.shift: _BIT_SHIFT, Key.shift_l: _BIT_SHIFT, Key.shift_r: _BIT_SHIFT,
+                Key.cmd: _BIT_WIN, Key.cmd_l: _BIT_WIN, Key.cmd_r: _BIT_WIN
+            }
+            self._key_to_bit = dict(self._modifier_key_bits)
+            self._main_button = None
+            self._combo_mask = 0
+            self._key_state = 0
             self.last_combo_state = False
-            self.key_listener = None
-            self.mouse_listener = None
+            self._trigger_pending = False
             
         except ImportError:
             self.pynput_available = False
@@ -77,7 +212,13 @@ class HotkeyManager:
         self.current_config = hotkey_config
         self.callback = callback
         
-        print(f"🎹 Setting up hotkey: {hotkey_config.display_name}")
+        # Per-method forms of the hotkey, computed once per configuration
+        self._kb_string = self._convert_for_keyboard_lib(hotkey_config.raw_value)
+        self._has_mouse_component = hotkey_config.main_key in _MOUSE_MAIN_KEYS
+        if self.pynput_available:
+            self._build_pynput_tables(hotkey_config)
+        
+        logger.info("🎹 Setting up hotkey: %s", hotkey_config.display_name)
         
         return self.start_listening()
     
@@ -86,6 +227,7 @@ class HotkeyManager:
         if self.is_listening or not self.current_config:
             return False
         
+        self._start_worker()
         methods_tried = []
         
         for method in self.method_priority:
@@ -107,7 +249,7 @@ class HotkeyManager:
                 if success:
                     self.active_method = method
                     self.is_listening = True
-                    print(f"✅ Using {method_name} method")
+                    logger.info("✅ Using %s method", method_name)
                     return True
                 else:
                     methods_tried.append(f"{method_name} (failed)")
@@ -116,16 +258,57 @@ class HotkeyManager:
                 methods_tried.append(f"{method.value} (error: {e})")
                 continue
         
-        print(f"❌ All hotkey methods failed: {', '.join(methods_tried)}")
+        logger.error("❌ All hotkey methods failed: %s", ', '.join(methods_tried))
         return False
     
+    def _start_worker(self):
+        """Start the callback worker if it is not already running"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='hotkey-cb')
+    
+    def _submit(self, callback: Callable) -> bool:
+        """Queue a callback on the worker, dropping it when the backlog is full"""
+        executor = self._executor
+        if executor is None or not self._pending_slots.acquire(blocking=False):
+            return False
+        
+        try:
+            future = executor.submit(self._run_callback, callback)
+        except RuntimeError:
+            # Worker was shut down by stop_listening in the meantime
+            self._pending_slots.release()
+            return False
+        
+        future.add_done_callback(self._release_slot)
+        return True
+    
+    def _run_callback(self, callback: Callable):
+        """Run one callback on the worker thread"""
+        try:
+            callback()
+        except Exception:
+            logger.exception("Error in hotkey callback")
+    
+    def _release_slot(self, _future):
+        """Free a backlog slot once a callback finishes or is cancelled"""
+        self._pending_slots.release()
+    
+    def _stop_worker(self):
+        """Shut the callback worker down, cancelling anything still queued"""
+        executor = self._executor
+        if executor is None:
+            return
+        
+        self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+    
     def _start_keyboard_method(self) -> bool:
         """Method 1: Use keyboard library"""
         if not self.keyboard_available or not self.current_config:
             return False
         
         try:
-            hotkey_string = self._convert_for_keyboard_lib(self.current_config.raw_value)
+            hotkey_string = self._kb_string
             
             def on_hotkey():
                 if self._should_trigger():
@@ -145,12 +328,12 @@ class HotkeyManager:
             return True
             
         except Exception as e:
-            print(f"Keyboard library method failed: {e}")
+            logger.warning("Keyboard library method failed: %s", e)
             return False
     
     def _start_win32_method(self) -> bool:
         """Method 2: Use Win32 RegisterHotKey"""
-        if not self.windows_api or not self.current_config:
+        if not self.windows_api or win32gui is None or not self.current_config:
             return False
         
         try:
@@ -158,6 +341,9 @@ class HotkeyManager:
             if vk_code is None:
                 return False
             
+            # Manual-reset event signalled by stop_listening to end the wait
+            self._stop_event = win32event.CreateEvent(None, True, False, None)
+            
             # Start background thread
             self.stop_thread = False
             self.hotkey_thread = threading.Thread(
@@ -170,7 +356,7 @@ class HotkeyManager:
             return True
             
         except Exception as e:
-            print(f"Win32 method failed: {e}")
+            logger.warning("Win32 method failed: %s", e)
             return False
     
     def _start_pynput_method(self) -> bool:
@@ -179,172 +365,210 @@ class HotkeyManager:
             return False
         
         try:
-            self.pressed_keys = set()
-            self.pressed_mouse = set()
+            self._key_state = 0
             self.last_combo_state = False
+            self._trigger_pending = False
+            
+            on_press, on_release, on_click = self._make_pynput_handlers()
+            key_filter, mouse_filter = self._make_win32_event_filters()
             
             # Keyboard listener
+            key_options = {'win32_event_filter': key_filter} if key_filter else {}
             self.key_listener = self.pynput_keyboard.Listener(
-                on_press=self._on_key_press,
-                on_release=self._on_key_release
+                on_press=on_press,
+                on_release=on_release,
+                suppress=False,
+                **key_options
             )
             
-            # Mouse listener (for mouse button hotkeys)
-            self.mouse_listener = self.pynput_mouse.Listener(
-                on_click=self._on_mouse_click
-            )
+            # Mouse listener only for mouse button hotkeys; otherwise skip the system-wide hook
+            if self._has_mouse_component:
+                mouse_options = {'win32_event_filter': mouse_filter} if mouse_filter else {}
+                self.mouse_listener = self.pynput_mouse.Listener(
+                    on_click=on_click,
+                    suppress=False,
+                    **mouse_options
+                )
             
             self.key_listener.start()
-            self.mouse_listener.start()
+            if self.mouse_listener:
+                self.mouse_listener.start()
             
             return True
             
         except Exception as e:
-            print(f"Pynput method failed: {e}")
+            logger.warning("Pynput method failed: %s", e)
             return False
     
     def _win32_hotkey_thread(self, vk_code: int, modifiers: int):
         """Background thread for Win32 hotkey handling"""
         try:
-            import win32gui
-            import win32con
+            stop_event = self._stop_event
+            enqueue = self._submit
+            callback = self.callback
+            wm_hotkey = win32con.WM_HOTKEY
+            peek_message = win32gui.PeekMessage
+            pm_remove = win32con.PM_REMOVE
             
             # Register hotkey
             hotkey_id = 1
             if not win32gui.RegisterHotKey(None, hotkey_id, modifiers, vk_code):
-                print("Failed to register Win32 hotkey")
+                logger.warning("Failed to register Win32 hotkey")
                 return
             
             try:
-                # Message loop
+                # Block in the kernel until a hotkey is posted or stop is signalled
                 while not self.stop_thread:
-                    try:
-                        msg = win32gui.GetMessage(None, 0, 0)
-                        if msg and len(msg) > 1 and len(msg[1]) > 1:
-                            if msg[1][1] == win32con.WM_HOTKEY:
-                                if self._should_trigger():
-                                    self._trigger_callback()
-                    except:
-                        time.sleep(0.01)
+                    rc = win32event.MsgWaitForMultipleObjects(
+                        [stop_event], False, win32event.INFINITE, win32con.QS_HOTKEY
+                    )
+                    if rc == win32event.WAIT_OBJECT_0:
+                        break
+                    if rc != win32event.WAIT_OBJECT_0 + 1:
+                        logger.error("Unexpected Win32 wait result: %s", rc)
+                        break
+                    
+                    # Drain every queued message before waiting again. RegisterHotKey
+                    # already coalesces repeats, so hand off straight to the worker
+                    while True:
+                        has_msg, msg = peek_message(None, 0, 0, pm_remove)
+                        if not has_msg:
+                            break
+                        if msg[1] == wm_hotkey and callback:
+                            enqueue(callback)
                         
             finally:
                 win32gui.UnregisterHotKey(None, hotkey_id)
                 
-        except Exception as e:
-            print(f"Win32 hotkey thread error: {e}")
-    
-    def _on_key_press(self, key):
-        """Handle key press events (pynput)"""
-        self.pressed_keys.add(key)
-        self._check_combo_and_trigger()
-    
-    def _on_key_release(self, key):
-        """Handle key release events (pynput)"""
-        if key in self.pressed_keys:
-            self.pressed_keys.remove(key)
-        self._check_combo_and_trigger()
-    
-    def _on_mouse_click(self, x, y, button, pressed):
-        """Handle mouse click events (pynput)"""
-        if pressed:
-            self.pressed_mouse.add(button)
-        else:
-            if button in self.pressed_mouse:
-                self.pressed_mouse.remove(button)
-        
-        self._check_combo_and_trigger()
-    
-    def _check_combo_and_trigger(self):
-        """Check if hotkey combination is active and trigger if needed (pynput)"""
-        if not self.current_config:
-            return
+        except pywintypes.error as e:
+            logger.error("Win32 hotkey thread error: %s", e)
+    
+    def _make_win32_event_filters(self) -> tuple:
+        """Build pynput win32_event_filter callbacks that drop irrelevant events early"""
+        if sys.platform != "win32" or not _VK_CODE_TABLE or not self.current_config:
+            return (None, None)
+        
+        config = self.current_config
+        key_filter = None
+        mouse_filter = None
         
-        combo_active = self._is_combo_active_pynput()
+        # Returning False stops pynput before it translates the event and calls us;
+        # the event still reaches every other application (nothing is suppressed)
+        main_vk = _VK_CODE_TABLE.get(config.main_key)
+        if main_vk or self._has_mouse_component:
+            relevant_vks = set()
+            if main_vk:
+                relevant_vks.add(main_vk)
+            for modifier in config.modifiers:
+                relevant_vks.update(_MODIFIER_VKS[modifier])
+            relevant_vks = frozenset(relevant_vks)
+            
+            def key_filter(msg, data):
+                return data.vkCode in relevant_vks
         
-        # Only trigger on state change from False to True
-        if combo_active and not self.last_combo_state and self._should_trigger():
-            self._trigger_callback()
+        button_msgs = _MOUSE_BUTTON_MSGS.get(config.main_key)
+        if button_msgs:
+            def mouse_filter(msg, data):
+                return msg in button_msgs
         
-        self.last_combo_state = combo_active
+        return (key_filter, mouse_filter)
     
-    def _is_combo_active_pynput(self) -> bool:
-        """Check if the current combination matches our hotkey (pynput)"""
-        if not self.current_config:
-            return False
+    def _make_pynput_handlers(self) -> tuple:
+        """Build the pynput callbacks with the hotkey tables bound as locals"""
+        bit_for = self._key_to_bit.get
+        combo_mask = self._combo_mask
+        main_button = self._main_button
+        should_trigger = self._should_trigger
+        enqueue = self._submit
+        run_and_clear = self._run_and_clear
         
-        try:
-            # Check modifiers
-            for modifier in self.current_config.modifiers:
-                if not self._is_modifier_pressed(modifier):
-                    return False
+        def press(bit):
+            state = self._key_state | bit
+            self._key_state = state
+            combo_active = (state & combo_mask) == combo_mask
             
-            # Check main key
-            return self._is_main_key_pressed(self.current_config.main_key)
+            # Only trigger on state change from False to True, and never while a
+            # previous trigger is still queued or running (single-flight)
+            if (combo_active and not self.last_combo_state
+                    and not self._trigger_pending and should_trigger()):
+                self._trigger_pending = True
+                if not enqueue(run_and_clear):
+                    self._trigger_pending = False
             
-        except Exception:
-            return False
+            self.last_combo_state = combo_active
+        
+        def release(bit):
+            self._key_state &= ~bit
+            # Releasing any part of the combo deactivates it
+            if bit & combo_mask:
+                self.last_combo_state = False
+        
+        def on_press(key):
+            bit = bit_for(key)
+            if bit:
+                press(bit)
+        
+        def on_release(key):
+            bit = bit_for(key)
+            if bit:
+                release(bit)
+        
+        def on_click(x, y, button, pressed):
+            if button == main_button:
+                if pressed:
+                    press(_BIT_MAIN)
+                else:
+                    release(_BIT_MAIN)
+        
+        return on_press, on_release, on_click
     
-    def _is_modifier_pressed(self, modifier) -> bool:
-        """Check if a modifier key is pressed (pynput)"""
-        from models.hotkey import ModifierKey
-        
-        if modifier == ModifierKey.CTRL:
-            return (self.pynput_keyboard.Key.ctrl_l in self.pressed_keys or 
-                   self.pynput_keyboard.Key.ctrl_r in self.pressed_keys)
-        elif modifier == ModifierKey.ALT:
-            return (self.pynput_keyboard.Key.alt_l in self.pressed_keys or 
-                   self.pynput_keyboard.Key.alt_r in self.pressed_keys)
-        elif modifier == ModifierKey.SHIFT:
-            return (self.pynput_keyboard.Key.shift_l in self.pressed_keys or 
-                   self.pynput_keyboard.Key.shift_r in self.pressed_keys)
-        return False
+    def _run_and_clear(self):
+        """Run the callback on the worker and re-arm pynput triggering"""
+        try:
+            if self.callback:
+                self.callback()
+        finally:
+            self._trigger_pending = False
     
-    def _is_main_key_pressed(self, main_key: str) -> bool:
-        """Check if the main key is pressed (pynput)"""
-        # Function keys
-        if main_key.startswith('f') and main_key[1:].isdigit():
-            f_num = int(main_key[1:])
-            f_key_map = {
-                1: self.pynput_keyboard.Key.f1, 2: self.pynput_keyboard.Key.f2,
-                3: self.pynput_keyboard.Key.f3, 4: self.pynput_keyboard.Key.f4,
-                5: self.pynput_keyboard.Key.f5, 6: self.pynput_keyboard.Key.f6,
-                7: self.pynput_keyboard.Key.f7, 8: self.pynput_keyboard.Key.f8,
-                9: self.pynput_keyboard.Key.f9, 10: self.pynput_keyboard.Key.f10,
-                11: self.pynput_keyboard.Key.f11, 12: self.pynput_keyboard.Key.f12
-            }
-            return f_key_map.get(f_num) in self.pressed_keys
-        
-        # Special keys
-        special_keys = {
-            'tab': self.pynput_keyboard.Key.tab,
-            'space': self.pynput_keyboard.Key.space,
-            'enter': self.pynput_keyboard.Key.enter,
-            'escape': self.pynput_keyboard.Key.esc,
-            'backspace': self.pynput_keyboard.Key.backspace,
-            'delete': self.pynput_keyboard.Key.delete,
-            'up': self.pynput_keyboard.Key.up,
-            'down': self.pynput_keyboard.Key.down,
-            'left': self.pynput_keyboard.Key.left,
-            'right': self.pynput_keyboard.Key.right
-        }
-        
-        if main_key in special_keys:
-            return special_keys[main_key] in self.pressed_keys
-        
-        # Mouse buttons
-        if main_key == 'middle':
-            return self.pynput_mouse.Button.middle in self.pressed_mouse
-        elif main_key == 'mouse4':
-            return self.pynput_mouse.Button.x1 in self.pressed_mouse
-        elif main_key == 'mouse5':
-            return self.pynput_mouse.Button.x2 in self.pressed_mouse
+    def _build_pynput_tables(self, config: HotkeyConfig):
+        """Precompute the key-to-bit table and combo mask for a hotkey (pynput)"""
+        key_to_bit = dict(self._modifier_key_bits)
+        main_button = None
+        
+        main_key = self._resolve_pynput_main_key(config.main_key)
+        if isinstance(main_key, self.pynput_mouse.Button):
+            main_button = main_key
+        elif isinstance(main_key, tuple):
+            # Letters arrive upper-cased while Shift is held
+            for key in main_key:
+                key_to_bit[key] = _BIT_MAIN
+        elif main_key is not None:
+            key_to_bit[main_key] = _BIT_MAIN
+        
+        combo_mask = _BIT_MAIN
+        for modifier in config.modifiers:
+            combo_mask |= _MODIFIER_BITS[modifier.value]
+        
+        self._key_to_bit = key_to_bit
+        self._main_button = main_button
+        self._combo_mask = combo_mask
+    
+    def _resolve_pynput_main_key(self, main_key: str):
+        """Resolve the main key to the pynput key or button object it arrives as"""
+        # Function keys, special keys and mouse buttons
+        key = _F_KEY_MAP.get(main_key) or _SPECIAL_KEY_MAP.get(main_key) or _MOUSE_BUTTON_MAP.get(main_key)
+        if key is not None:
+            return key
         
         # Regular keys (letters, numbers)
         if len(main_key) == 1:
-            key_code = self.pynput_keyboard.KeyCode.from_char(main_key)
-            return key_code in self.pressed_keys
+            key_codes = {
+                self.pynput_keyboard.KeyCode.from_char(main_key),
+                self.pynput_keyboard.KeyCode.from_char(main_key.upper())
+            }
+            return tuple(key_codes)
         
-        return False
+        return None
     
     def _convert_for_keyboard_lib(self, hotkey: str) -> str:
         """Convert hotkey format for keyboard library"""
@@ -360,90 +584,35 @@ class HotkeyManager:
     
     def _convert_for_win32(self, config: HotkeyConfig) -> tuple:
         """Convert hotkey config to Win32 virtual key codes"""
-        try:
-            import win32con
-            from models.hotkey import ModifierKey
-            
-            # Calculate modifier flags
-            mod_flags = 0
-            for modifier in config.modifiers:
-                if modifier == ModifierKey.CTRL:
-                    mod_flags |= win32con.MOD_CONTROL
-                elif modifier == ModifierKey.ALT:
-                    mod_flags |= win32con.MOD_ALT
-                elif modifier == ModifierKey.SHIFT:
-                    mod_flags |= win32con.MOD_SHIFT
-                elif modifier == ModifierKey.WIN:
-                    mod_flags |= win32con.MOD_WIN
-            
-            # Get virtual key code
-            vk_code = self._get_vk_code(config.main_key)
-            
-            return (vk_code, mod_flags) if vk_code else (None, None)
-            
-        except Exception:
+        vk_code = self._get_vk_code(config.main_key)
+        if not vk_code:
             return (None, None)
+        
+        mod_flags = _MOD_NOREPEAT
+        for modifier in config.modifiers:
+            mod_flags |= _MOD_FLAG_MAP[modifier]
+        
+        return (vk_code, mod_flags)
     
     def _get_vk_code(self, key: str) -> Optional[int]:
         """Get Windows virtual key code for a key"""
-        try:
-            import win32con
-            
-            # Function keys
-            if key.startswith('f') and key[1:].isdigit():
-                f_num = int(key[1:])
-                if 1 <= f_num <= 12:
-                    return win32con.VK_F1 + (f_num - 1)
-            
-            # Special keys
-            special_vk_map = {
-                'space': win32con.VK_SPACE,
-                'tab': win32con.VK_TAB,
-                'enter': win32con.VK_RETURN,
-                'escape': win32con.VK_ESCAPE,
-                'backspace': win32con.VK_BACK,
-                'delete': win32con.VK_DELETE,
-                'up': win32con.VK_UP,
-                'down': win32con.VK_DOWN,
-                'left': win32con.VK_LEFT,
-                'right': win32con.VK_RIGHT
-            }
-            
-            if key in special_vk_map:
-                return special_vk_map[key]
-            
-            # Letters and numbers
-            if len(key) == 1:
-                if key.isalpha():
-                    return ord(key.upper())
-                elif key.isdigit():
-                    return ord(key)
-            
-            # Mouse buttons not supported by Win32 RegisterHotKey
-            if key in ['middle', 'mouse4', 'mouse5']:
-                return None
-            
-            return None
-            
-        except Exception:
-            return None
+        return _VK_CODE_TABLE.get(key)
     
     def _should_trigger(self) -> bool:
         """Check if enough time has passed since last trigger (debounce)"""
-        current_time = time.time()
-        if current_time - self.last_trigger_time >= self.min_trigger_interval:
-            self.last_trigger_time = current_time
-            return True
+        now = time.monotonic_ns()
+        # Listener threads can race here; check-and-set under the lock
+        with self._trigger_lock:
+            if now - self._last_trigger_ns >= self.min_trigger_interval_ns:
+                self._last_trigger_ns = now
+                return True
         return False
     
     def _trigger_callback(self):
-        """Trigger the callback in a separate thread"""
+        """Hand the callback to the worker thread"""
         if self.callback:
-            try:
-                print(f"🎹 Hotkey triggered: {self.current_config.display_name}")
-                threading.Thread(target=self.callback, daemon=True).start()
-            except Exception as e:
-                print(f"Error in hotkey callback: {e}")
+            logger.debug("🎹 Hotkey triggered: %s", self.current_config.display_name)
+            self._submit(self.callback)
     
     def stop_listening(self):
         """Stop listening for hotkeys"""
@@ -452,32 +621,31 @@ class HotkeyManager:
         # Stop Win32 thread
         if self.hotkey_thread:
             self.stop_thread = True
+            if self._stop_event is not None:
+                win32event.SetEvent(self._stop_event)
             self.hotkey_thread = None
         
         # Stop keyboard library
         if self.keyboard_available and self.keyboard:
             try:
                 self.keyboard.unhook_all()
-            except:
-                pass
+            except Exception as e:
+                logger.warning("Failed to unhook keyboard library: %s", e)
         
         # Stop pynput listeners
-        if hasattr(self, 'key_listener') and self.key_listener:
-            try:
-                self.key_listener.stop()
-                self.key_listener = None
-            except:
-                pass
+        for listener in (self.key_listener, self.mouse_listener):
+            if listener:
+                try:
+                    listener.stop()
+                except Exception as e:
+                    logger.warning("Failed to stop pynput listener: %s", e)
+        self.key_listener = None
+        self.mouse_listener = None
         
-        if hasattr(self, 'mouse_listener') and self.mouse_listener:
-            try:
-                self.mouse_listener.stop()
-                self.mouse_listener = None
-            except:
-                pass
+        self._stop_worker()
         
         self.active_method = None
-        print("🔇 Hotkey listening stopped")
+        logger.info("🔇 Hotkey listening stopped")
     
     def get_status(self) -> dict:
         """Get current status information"""
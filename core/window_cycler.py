@@ -2,7 +2,9 @@
 Core window cycling functionality with advanced activation methods
 """
 
-from typing import List, Optional, Callable
+from operator import attrgetter
+from typing import List, Optional, Callable, Dict, Tuple
+import logging
 import time
 
 from models.game_window import GameWindow
@@ -10,6 +12,8 @@ from models.hotkey import HotkeyConfig
 from core.hotkey_manager import HotkeyManager
 from utils.platform_utils import get_windows_api
 
+logger = logging.getLogger(__name__)
+
 
 class WindowCycler:
     """Handles window cycling logic and activation"""
@@ -17,6 +21,14 @@ class WindowCycler:
     def __init__(self):
         self.windows: List[GameWindow] = []
         self.current_index = 0
+        
+        # Tombstones for windows found dead mid-cycle; compacted in one pass
+        self._alive = bytearray()
+        self._dead_count = 0
+        
+        # hwnd -> (checked_at, is_valid); avoids repeat IsWindow calls within one press
+        self._valid_cache: Dict[int, Tuple[float, bool]] = {}
+        self.valid_cache_ttl = 0.1
         self.hotkey_manager = HotkeyManager()
         self.windows_api = get_windows_api()
         
@@ -29,108 +41,158 @@ class WindowCycler:
         self.total_cycles = 0
         self.successful_activations = 0
         self.failed_activations = 0
+        self._stats_cache: Optional[dict] = None
+        self._stats_dirty = True
     
     def set_windows(self, windows: List[GameWindow]) -> bool:
         """Set the windows to cycle through"""
         if not windows:
             return False
         
-        # Sort by order and validate
-        valid_windows = [w for w in windows if w.is_valid_handle()]
+        # Validate against one enumeration of live windows instead of a call per window,
+        # falling back to per-window checks if the enumeration fails
+        live_hwnds = self.windows_api.get_visible_window_handles() if self.windows_api else None
+        if live_hwnds is not None:
+            valid_windows = [w for w in windows if w.hwnd in live_hwnds]
+        else:
+            valid_windows = [w for w in windows if w.is_valid_handle()]
         
         if not valid_windows:
-            print("❌ No valid windows to cycle")
+            logger.error("❌ No valid windows to cycle")
             return False
         
-        self.windows = sorted(valid_windows, key=lambda w: w.order)
+        # Sort by order in place (linear when the UI already hands them in order)
+        valid_windows.sort(key=attrgetter('order'))
+        self.windows = valid_windows
+        self._reset_alive()
         self.current_index = 0
         
-        print(f"✅ Window cycling set up with {len(self.windows)} windows:")
-        for i, window in enumerate(self.windows):
-            print(f"   {i+1}. {window.get_display_name()}")
+        logger.info("✅ Window cycling set up with %d windows:", len(self.windows))
+        if logger.isEnabledFor(logging.INFO):
+            for i, window in enumerate(self.windows):
+                logger.info("   %d. %s", i + 1, window.get_display_name())
         
         return True
     
     def set_hotkey(self, hotkey_config: HotkeyConfig) -> bool:
         """Set the hotkey for cycling"""
-        return self.hotkey_manager.set_hotkey(hotkey_config, self.cycle_next)
+        self._stats_dirty = True
+        # Look cycle_next up per press so the single-window fast path is honoured
+        return self.hotkey_manager.set_hotkey(hotkey_config, lambda: self.cycle_next())
     
     def start_cycling(self) -> bool:
         """Start the cycling system"""
         if not self.windows:
-            print("❌ No windows configured for cycling")
+            logger.error("❌ No windows configured for cycling")
             return False
         
         if not self.hotkey_manager.is_listening:
-            print("❌ Hotkey not properly configured")
+            logger.error("❌ Hotkey not properly configured")
             return False
         
-        print(f"🎮 Window cycling started with {len(self.windows)} windows")
+        logger.info("🎮 Window cycling started with %d windows", len(self.windows))
         return True
     
     def stop_cycling(self):
         """Stop the cycling system"""
+        self._stats_dirty = True
         self.hotkey_manager.stop_listening()
         
         if self.on_cycling_stopped:
             self.on_cycling_stopped()
         
-        print("🔇 Window cycling stopped")
+        logger.info("🔇 Window cycling stopped")
     
     def cycle_next(self):
         """Cycle to the next window"""
         if not self.windows:
-            print("❌ No windows to cycle through")
+            logger.warning("❌ No windows to cycle through")
             return
         
         self.total_cycles += 1
-        max_attempts = len(self.windows)
-        attempts = 0
+        self._stats_dirty = True
+        windows = self.windows
+        alive = self._alive
+        count = len(windows)
+        index = self.current_index if self.current_index < count else 0
         
-        while attempts < max_attempts:
-            # Ensure index is valid
-            if self.current_index >= len(self.windows):
-                self.current_index = 0
-            
-            window = self.windows[self.current_index]
-            print(f"🔄 Attempting to cycle to window {self.current_index + 1}: {window.get_display_name()}")
-            
-            # Check if window still exists
-            if not window.is_valid_handle():
-                print(f"❌ Window no longer valid, removing from list")
-                self._remove_invalid_window(self.current_index)
+        try:
+            # Visit each window at most once, starting from the current one
+            for _ in range(count):
+                if not alive[index]:
+                    index = (index + 1) % count
+                    continue
                 
-                if not self.windows:
-                    print("❌ No valid windows remaining")
-                    self.stop_cycling()
-                    return
+                window = windows[index]
+                logger.debug("🔄 Attempting to cycle to window %d: %s", index + 1, window)
                 
-                # Don't increment index since we removed an item
-                continue
+                # Check if window still exists
+                if not self._is_valid_cached(window):
+                    logger.warning("❌ Window no longer valid, removing from list")
+                    self._mark_invalid(index)
+                    index = (index + 1) % count
+                    continue
+                
+                # Try to activate the window
+                success = self._activate_window(window)
+                
+                # Move to next window for next cycle (or next attempt)
+                index = (index + 1) % count
+                self.current_index = index
+                
+                if success:
+                    logger.info("✅ Successfully activated: %s", window.get_display_name())
+                    self.successful_activations += 1
+                    
+                    if self.on_window_activated:
+                        self.on_window_activated(window)
+                    
+                    return
+                else:
+                    logger.warning("⚠️ Failed to activate window, trying next...")
+                    self.failed_activations += 1
+            
+            self.current_index = index
+            if self._dead_count == count:
+                logger.error("❌ No valid windows remaining")
+                self._compact_windows()
+                self.stop_cycling()
+                return
             
-            # Try to activate the window
-            success = self._activate_window(window)
+            logger.error("❌ Could not activate any window after trying all options")
             
-            if success:
-                print(f"✅ Successfully activated: {window.get_display_name()}")
+        finally:
+            if self._dead_count:
+                self._compact_windows()
+            self._stats_dirty = True
+    
+    def _cycle_single(self):
+        """Fast path installed as cycle_next when exactly one window is configured"""
+        if len(self.windows) != 1:
+            return WindowCycler.cycle_next(self)
+        
+        window = self.windows[0]
+        self.total_cycles += 1
+        
+        try:
+            if not self._is_valid_cached(window):
+                logger.warning("❌ Window no longer valid, removing from list")
+                self._remove_invalid_window(0)
+                logger.error("❌ No valid windows remaining")
+                self.stop_cycling()
+                return
+            
+            if self._activate_window(window):
+                logger.info("✅ Successfully activated: %s", window.get_display_name())
                 self.successful_activations += 1
                 
-                # Move to next window for next cycle
-                self.current_index = (self.current_index + 1) % len(self.windows)
-                
                 if self.on_window_activated:
                     self.on_window_activated(window)
-                
-                return
             else:
-                print(f"⚠️ Failed to activate window, trying next...")
+                logger.error("❌ Could not activate any window after trying all options")
                 self.failed_activations += 1
-            
-            # Move to next window and try again
-            self.current_index = (self.current_index + 1) % len(self.windows)
-            attempts += 1
-        
-        print("❌ Could not activate any window after trying all options")
+        finally:
+            self._stats_dirty = True
     
     def cycle_to_specific(self, window_index: int) -> bool:
         """Cycle to a specific window by index"""
@@ -138,8 +200,9 @@ class WindowCycler:
             return False
         
         window = self.windows[window_index]
+        self._stats_dirty = True
         
-        if not window.is_valid_handle():
+        if not self._is_valid_cached(window):
             self._remove_invalid_window(window_index)
             return False
         
@@ -162,63 +225,103 @@ class WindowCycler:
     def _activate_window(self, window: GameWindow) -> bool:
         """Activate a window using multiple fallback methods"""
         if not self.windows_api:
-            print("❌ Windows API not available")
+            logger.error("❌ Windows API not available")
             return False
         
-        print(f"   Attempting to activate: {window.get_display_name()}")
+        logger.debug("   Attempting to activate: %s", window)
         
         return self.windows_api.activate_window(window.hwnd)
     
+    def _is_valid_cached(self, window: GameWindow) -> bool:
+        """Check a window handle, reusing results younger than the cache TTL"""
+        now = time.monotonic()
+        cached = self._valid_cache.get(window.hwnd)
+        if cached and now - cached[0] < self.valid_cache_ttl:
+            return cached[1]
+        
+        is_valid = window.is_valid_handle()
+        self._valid_cache[window.hwnd] = (now, is_valid)
+        return is_valid
+    
     def _remove_invalid_window(self, index: int):
         """Remove an invalid window from the cycling list"""
         if 0 <= index < len(self.windows):
-            removed_window = self.windows.pop(index)
-            
-            # Adjust current index if needed
-            if self.current_index >= len(self.windows) and self.windows:
-                self.current_index = 0
-            
-            if self.on_window_removed:
-                self.on_window_removed(removed_window)
-            
-            print(f"🗑️ Removed invalid window: {removed_window.get_display_name()}")
+            self._mark_invalid(index)
+            self._compact_windows()
+    
+    def _mark_invalid(self, index: int):
+        """Tombstone an invalid window without shifting the list"""
+        if not self._alive[index]:
+            return
+        
+        self._alive[index] = 0
+        self._dead_count += 1
+        removed_window = self.windows[index]
+        
+        if self.on_window_removed:
+            self.on_window_removed(removed_window)
+        
+        logger.info("🗑️ Removed invalid window: %s", removed_window.get_display_name())
+    
+    def _compact_windows(self):
+        """Drop tombstoned windows in a single pass and remap the current index"""
+        alive = self._alive
+        
+        # Windows before the cursor that survive decide where it lands
+        self.current_index = alive[:self.current_index].count(1)
+        self.windows = [w for w, keep in zip(self.windows, alive) if keep]
+        self._reset_alive()
+        
+        if self.current_index >= len(self.windows):
+            self.current_index = 0
+    
+    def _reset_alive(self):
+        """Mark every window in the current list as alive"""
+        self._alive = bytearray(b'\x01') * len(self.windows)
+        self._dead_count = 0
+        self._valid_cache.clear()
+        self._stats_dirty = True
+        
+        # Specialize cycle_next for the common single-window case
+        if len(self.windows) == 1:
+            self.cycle_next = self._cycle_single
+        else:
+            vars(self).pop('cycle_next', None)
     
     def refresh_window_validity(self):
         """Check all windows and remove invalid ones"""
         original_count = len(self.windows)
         
-        # Remove invalid windows (iterate backwards to avoid index issues)
-        for i in range(len(self.windows) - 1, -1, -1):
-            if not self.windows[i].is_valid_handle():
-                self._remove_invalid_window(i)
+        for i, window in enumerate(self.windows):
+            if not self._is_valid_cached(window):
+                self._mark_invalid(i)
+        
+        if self._dead_count:
+            self._compact_windows()
         
         removed_count = original_count - len(self.windows)
         if removed_count > 0:
-            print(f"🧹 Removed {removed_count} invalid window(s)")
+            logger.info("🧹 Removed %d invalid window(s)", removed_count)
     
     def reorder_windows(self, new_order: List[int]) -> bool:
         """Reorder windows based on new order list"""
         if len(new_order) != len(self.windows):
             return False
         
-        try:
-            # Create new ordered list
-            new_windows = []
-            for order in new_order:
-                if 0 <= order < len(self.windows):
-                    new_windows.append(self.windows[order])
-                else:
-                    return False
-            
-            self.windows = new_windows
-            self.current_index = 0
-            
-            print(f"🔀 Reordered {len(self.windows)} windows")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Failed to reorder windows: {e}")
-            return False
+        # Create new ordered list
+        new_windows = []
+        for order in new_order:
+            if 0 <= order < len(self.windows):
+                new_windows.append(self.windows[order])
+            else:
+                return False
+        
+        self.windows = new_windows
+        self._reset_alive()
+        self.current_index = 0
+        
+        logger.info("🔀 Reordered %d windows", len(self.windows))
+        return True
     
     def get_current_window(self) -> Optional[GameWindow]:
         """Get the currently selected window"""
@@ -240,22 +343,27 @@ class WindowCycler:
     
     def get_statistics(self) -> dict:
         """Get cycling statistics"""
-        return {
-            'total_cycles': self.total_cycles,
-            'successful_activations': self.successful_activations,
-            'failed_activations': self.failed_activations,
-            'success_rate': (self.successful_activations / max(1, self.total_cycles)) * 100,
-            'window_count': len(self.windows),
-            'current_index': self.current_index,
-            'is_listening': self.hotkey_manager.is_listening,
-            'hotkey_status': self.hotkey_manager.get_status()
-        }
+        # Rebuilt only after something that can change it; pollers get a copy
+        if self._stats_dirty or self._stats_cache is None:
+            self._stats_cache = {
+                'total_cycles': self.total_cycles,
+                'successful_activations': self.successful_activations,
+                'failed_activations': self.failed_activations,
+                'success_rate': (self.successful_activations / max(1, self.total_cycles)) * 100,
+                'window_count': len(self.windows),
+                'current_index': self.current_index,
+                'is_listening': self.hotkey_manager.is_listening,
+                'hotkey_status': self.hotkey_manager.get_status()
+            }
+            self._stats_dirty = False
+        return dict(self._stats_cache)
     
     def reset_statistics(self):
         """Reset cycling statistics"""
         self.total_cycles = 0
         self.successful_activations = 0
         self.failed_activations = 0
+        self._stats_dirty = True
     
     def is_cycling_active(self) -> bool:
         """Check if cycling is currently active"""
@@ -2,12 +2,27 @@
 Game window detection and analysis for Dofus and Wakfu
 """
 
+from functools import lru_cache
 from typing import List, Dict, Optional
+import re
 import sys
+import time
 
 from models.game_window import GameWindow
 from utils.platform_utils import get_windows_api
 
+# Imported once per process rather than on every detector construction
+try:
+    import psutil as _psutil
+except ImportError:
+    _psutil = None
+
+# Common separators used in game window titles, split on in a single pass
+_TITLE_SEPARATOR_RE = re.compile(r' - | \| | : |[\[\]()]')
+
+# Any Unicode letter (word characters minus digits and underscore)
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
 
 class GameWindowDetector:
     """Detects and analyzes Dofus/Wakfu windows"""
@@ -25,50 +40,91 @@ class GameWindowDetector:
     DOFUS_KEYWORDS = ['dofus', 'dofus retro', 'dofus unity', '- dofus', 'dofus -', '[dofus]']
     WAKFU_KEYWORDS = ['wakfu', '- wakfu', 'wakfu -', '[wakfu]']
     
+    # Lowercased game executable names for O(1) membership tests
+    _GAME_PROC_SET = frozenset(name.lower() for name in GAME_PROCESSES)
+    
+    # Unambiguous game executables (java.exe hosts either game and needs the title)
+    _PROC_TO_GAME = {
+        name.lower(): game for name, game in GAME_PROCESSES.items() if name.lower() != 'java.exe'
+    }
+    
+    # Skip terms for character name filtering, each matched in one regex pass
+    _DOFUS_SKIP_RE = re.compile(
+        'dofus|retro|unity|client|launcher|game|ankama|server|beta|alpha|test', re.IGNORECASE
+    )
+    _WAKFU_SKIP_RE = re.compile(
+        'wakfu|client|launcher|game|ankama|server|beta|alpha|test', re.IGNORECASE
+    )
+    _COMMON_TERMS = frozenset({
+        'version', 'build', 'client', 'server', 'beta', 'alpha',
+        'launcher', 'game', 'window', 'main', 'login'
+    })
+    
     def __init__(self):
         self.windows_api = get_windows_api()
         if not self.windows_api:
             raise RuntimeError("Windows API not available")
         
-        # Import psutil for process information
-        try:
-            import psutil
-            self.psutil = psutil
-        except ImportError:
+        # psutil for process information
+        if _psutil is None:
             raise RuntimeError("psutil library required")
+        self.psutil = _psutil
+        
+        # Short-lived snapshot so a list refresh and a stats query share one enumeration
+        self.cache_ttl = 0.2
+        self._cache: Optional[List[GameWindow]] = None
+        self._cache_ts = 0.0
     
     def get_all_game_windows(self) -> List[GameWindow]:
         """Find all Dofus/Wakfu windows currently open"""
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_ts < self.cache_ttl:
+            return list(self._cache)
+        
         windows = []
         
-        def enum_callback(hwnd, window_list):
+        # One process snapshot for the whole enumeration; only game PIDs are kept
+        game_processes = self._snapshot_game_processes()
+        if not game_processes:
+            self._cache, self._cache_ts = windows, now
+            return list(windows)
+        
+        # EnumWindows hands the callback its own throwaway extra argument, so
+        # collect into `windows` directly rather than into that parameter
+        def enum_callback(hwnd, _extra):
+            # Most windows belong to non-game processes: reject them with one lookup
+            process_id = self.windows_api.get_window_process_id(hwnd)
+            process_name = game_processes.get(process_id)
+            if process_name is None:
+                return True
+            
             if self.windows_api.is_window_visible(hwnd):
                 title = self.windows_api.get_window_title(hwnd)
                 if title:  # Skip windows without titles
-                    process_id = self.windows_api.get_window_process_id(hwnd)
-                    if process_id:
-                        try:
-                            process = self.psutil.Process(process_id)
-                            process_name = process.name()
-                            
-                            # Check if it's a game we care about
-                            if self._is_game_process(process_name):
-                                game_window = self._create_game_window(
-                                    hwnd, title, process_name, process_id
-                                )
-                                if game_window:
-                                    window_list.append(game_window)
-                                    
-                        except (self.psutil.NoSuchProcess, self.psutil.AccessDenied):
-                            pass
+                    game_window = self._create_game_window(
+                        hwnd, title, process_name, process_id
+                    )
+                    if game_window:
+                        windows.append(game_window)
             return True
         
         self.windows_api.enum_windows(enum_callback)
-        return windows
+        self._cache, self._cache_ts = windows, now
+        return list(windows)
+    
+    def invalidate(self):
+        """Drop the cached window snapshot so the next lookup re-enumerates"""
+        self._cache = None
     
-    def _is_game_process(self, process_name: str) -> bool:
-        """Check if process name matches a supported game"""
-        return process_name.lower() in [p.lower() for p in self.GAME_PROCESSES.keys()]
+    def _snapshot_game_processes(self) -> Dict[int, str]:
+        """Map the PID of every running game process to its name in a single pass"""
+        game_proc_set = self._GAME_PROC_SET
+        game_processes = {}
+        for proc in self.psutil.process_iter(['pid', 'name']):
+            name = proc.info['name']
+            if name and name.lower() in game_proc_set:
+                game_processes[proc.info['pid']] = name
+        return game_processes
     
     def _create_game_window(self, hwnd: int, title: str, process_name: str, 
                            process_id: int) -> Optional[GameWindow]:
@@ -90,45 +146,20 @@ class GameWindowDetector:
     
     def _detect_game_type(self, title: str, process_name: str) -> str:
         """Determine if window is Dofus or Wakfu"""
-        title_lower = title.lower()
-        
-        # Direct process name detection
+        # Direct process name detection: a dict hit for the known game executables
         process_lower = process_name.lower()
+        game_type = self._PROC_TO_GAME.get(process_lower)
+        if game_type:
+            return game_type
+        
         if 'dofus' in process_lower:
             return 'dofus'
         elif 'wakfu' in process_lower:
             return 'wakfu'
         
-        # Title-based detection for direct matches
-        for keyword in self.DOFUS_KEYWORDS:
-            if keyword in title_lower:
-                return 'dofus'
-        
-        for keyword in self.WAKFU_KEYWORDS:
-            if keyword in title_lower:
-                return 'wakfu'
-        
-        # Special handling for Java processes
-        if process_lower == 'java.exe':
-            return self._detect_java_game_type(title_lower)
-        
-        return ""
-    
-    def _detect_java_game_type(self, title_lower: str) -> str:
-        """Detect game type for Java processes (more sophisticated logic)"""
-        # Look for specific patterns that indicate the game type
-        dofus_patterns = ['- dofus', 'dofus -', '[dofus]', 'dofus retro', 'dofus unity']
-        wakfu_patterns = ['- wakfu', 'wakfu -', '[wakfu]', 'wakfu client']
-        
-        for pattern in dofus_patterns:
-            if pattern in title_lower:
-                return 'dofus'
-        
-        for pattern in wakfu_patterns:
-            if pattern in title_lower:
-                return 'wakfu'
-        
-        # If no specific patterns found, check for general keywords
+        # Title-based detection: every DOFUS_KEYWORDS/WAKFU_KEYWORDS entry contains
+        # the bare game name, so one substring test per game covers the whole table
+        title_lower = title.lower()
         if 'dofus' in title_lower:
             return 'dofus'
         elif 'wakfu' in title_lower:
@@ -144,21 +175,15 @@ class GameWindowDetector:
             # Fallback to simple extraction
             return self._extract_character_name_simple(title)
     
-    def _extract_character_name_advanced(self, title: str, game_type: str) -> str:
-        """Advanced character name extraction with game-specific logic"""
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _extract_character_name_advanced(cls, title: str, game_type: str) -> str:
+        """Advanced character name extraction with game-specific logic (memoized per title)"""
         if not title or len(title.strip()) < 3:
             return "Unknown Character"
         
-        # Common separators used in game window titles
-        separators = [' - ', ' | ', ' : ', '[', ']', '(', ')']
-        
         # Try to split by separators and find the character name
-        parts = [title]
-        for sep in separators:
-            new_parts = []
-            for part in parts:
-                new_parts.extend(part.split(sep))
-            parts = new_parts
+        parts = _TITLE_SEPARATOR_RE.split(title)
         
         # Clean and filter parts
         clean_parts = []
@@ -169,56 +194,49 @@ class GameWindowDetector:
         
         # Game-specific filtering
         if game_type == 'dofus':
-            return self._filter_dofus_character_name(clean_parts)
+            return cls._filter_dofus_character_name(clean_parts)
         elif game_type == 'wakfu':
-            return self._filter_wakfu_character_name(clean_parts)
+            return cls._filter_wakfu_character_name(clean_parts)
         
-        return self._extract_character_name_generic(clean_parts)
+        return cls._extract_character_name_generic(clean_parts)
     
-    def _filter_dofus_character_name(self, parts: List[str]) -> str:
+    @classmethod
+    def _filter_dofus_character_name(cls, parts: List[str]) -> str:
         """Filter parts to find Dofus character name"""
         # Skip common Dofus-related terms
-        skip_terms = {
-            'dofus', 'retro', 'unity', 'client', 'launcher', 'game', 
-            'ankama', 'server', 'beta', 'alpha', 'test'
-        }
+        skip_search = cls._DOFUS_SKIP_RE.search
         
         candidates = []
         for part in parts:
-            part_lower = part.lower()
-            if not any(term in part_lower for term in skip_terms):
+            if not skip_search(part):
                 # Check if it looks like a character name (letters, maybe numbers)
-                if self._looks_like_character_name(part):
+                if cls._looks_like_character_name(part):
                     candidates.append(part)
         
         if candidates:
             # Prefer shorter names (likely character names vs server names)
-            candidates.sort(key=len)
-            return candidates[0]
+            return min(candidates, key=len)
         
-        return self._extract_character_name_generic(parts)
+        return cls._extract_character_name_generic(parts)
     
-    def _filter_wakfu_character_name(self, parts: List[str]) -> str:
+    @classmethod
+    def _filter_wakfu_character_name(cls, parts: List[str]) -> str:
         """Filter parts to find Wakfu character name"""
-        skip_terms = {
-            'wakfu', 'client', 'launcher', 'game', 'ankama', 
-            'server', 'beta', 'alpha', 'test'
-        }
+        skip_search = cls._WAKFU_SKIP_RE.search
         
         candidates = []
         for part in parts:
-            part_lower = part.lower()
-            if not any(term in part_lower for term in skip_terms):
-                if self._looks_like_character_name(part):
+            if not skip_search(part):
+                if cls._looks_like_character_name(part):
                     candidates.append(part)
         
         if candidates:
-            candidates.sort(key=len)
-            return candidates[0]
+            return min(candidates, key=len)
         
-        return self._extract_character_name_generic(parts)
+        return cls._extract_character_name_generic(parts)
     
-    def _extract_character_name_generic(self, parts: List[str]) -> str:
+    @staticmethod
+    def _extract_character_name_generic(parts: List[str]) -> str:
         """Generic character name extraction"""
         if not parts:
             return "Unknown Character"
@@ -228,9 +246,8 @@ class GameWindowDetector:
         candidates = [p for p in parts if 2 < len(p) < 20]
         
         if candidates:
-            # Sort by length and take the shortest reasonable one
-            candidates.sort(key=len)
-            return candidates[0]
+            # Take the shortest reasonable one
+            return min(candidates, key=len)
         
         # Fallback to first part or truncated title
         first_part = parts[0] if parts else "Unknown"
@@ -244,29 +261,16 @@ class GameWindowDetector:
         # Just return truncated title as fallback
         return title[:30] + "..." if len(title) > 30 else title
     
-    def _looks_like_character_name(self, text: str) -> bool:
+    @classmethod
+    def _looks_like_character_name(cls, text: str) -> bool:
         """Check if text looks like a character name"""
-        if not text or len(text) < 2 or len(text) > 25:
-            return False
-        
-        # Character names usually contain letters
-        if not any(c.isalpha() for c in text):
-            return False
-        
-        # Skip parts that look like version numbers or IDs
-        if text.replace('.', '').replace('-', '').isdigit():
-            return False
-        
-        # Skip common non-character terms
-        common_terms = {
-            'version', 'build', 'client', 'server', 'beta', 'alpha',
-            'launcher', 'game', 'window', 'main', 'login'
-        }
-        
-        if text.lower() in common_terms:
-            return False
-        
-        return True
+        # Character names usually contain letters; anything with a letter can't be
+        # a bare version number or ID, so no separate digit check is needed
+        return (
+            2 <= len(text) <= 25
+            and _LETTER_RE.search(text) is not None
+            and text.lower() not in cls._COMMON_TERMS
+        )
     
     def refresh_window_info(self, game_window: GameWindow) -> bool:
         """Refresh information for an existing game window"""
@@ -275,9 +279,9 @@ class GameWindowDetector:
             if not self.windows_api.is_window_valid(game_window.hwnd):
                 return False
             
-            # Update title (character might have changed)
+            # Update title (character might have changed); nothing to redo if it didn't
             new_title = self.windows_api.get_window_title(game_window.hwnd)
-            if new_title:
+            if new_title and new_title != game_window.title:
                 game_window.title = new_title
                 game_window.character_name = self._extract_character_name(
                     new_title, game_window.game_type
@@ -292,11 +296,23 @@ class GameWindowDetector:
         """Get statistics about detected games"""
         windows = self.get_all_game_windows()
         
+        # Single pass over the windows instead of one comprehension per counter
+        dofus_windows = wakfu_windows = 0
+        characters = set()
+        for window in windows:
+            game_type = window.game_type
+            if game_type == 'dofus':
+                dofus_windows += 1
+            elif game_type == 'wakfu':
+                wakfu_windows += 1
+            if window.character_name:
+                characters.add(window.character_name)
+        
         stats = {
             'total_windows': len(windows),
-            'dofus_windows': len([w for w in windows if w.game_type == 'dofus']),
-            'wakfu_windows': len([w for w in windows if w.game_type == 'wakfu']),
-            'unique_characters': len(set(w.character_name for w in windows if w.character_name))
+            'dofus_windows': dofus_windows,
+            'wakfu_windows': wakfu_windows,
+            'unique_characters': len(characters)
         }
         
         return stats
\ No newline at end of file
@@ -4,8 +4,6 @@ Status bar widget for displaying application status and progress
 
 import tkinter as tk
 from tkinter import ttk
-import threading
-import time
 from typing import Optional
 
 
@@ -17,6 +15,12 @@ class StatusBarWidget(ttk.Frame):
         
         self.current_message = ""
         self.is_busy = False
+        
+        # Pending revert of a temporary message (one at a time, scheduled with after())
+        self._revert_id: Optional[str] = None
+        self._revert_message = ""
+        self._revert_fg: Optional[str] = None
+        
         self._create_widget()
     
     def _create_widget(self):
@@ -69,51 +73,43 @@ class StatusBarWidget(ttk.Frame):
     
     def set_temporary_message(self, message: str, duration: float = 3.0):
         """Set a temporary message that reverts after duration"""
-        original_message = self.current_message
-        self.set_message(message)
+        if self._revert_id is None:
+            self._revert_message = self.current_message
+        else:
+            # A newer temporary message replaces the pending one
+            self.after_cancel(self._revert_id)
         
-        def revert_message():
-            time.sleep(duration)
-            if self.current_message == message:  # Only revert if message wasn't changed
-                self.set_message(original_message)
+        self.set_message(message)
+        self._revert_id = self.after(int(duration * 1000), self._revert_temporary, message)
+    
+    def _revert_temporary(self, message: str):
+        """Restore the message and color saved before the temporary message"""
+        self._revert_id = None
+        if self.current_message == message:  # Only revert if message wasn't changed
+            self.set_message(self._revert_message)
         
-        threading.Thread(target=revert_message, daemon=True).start()
+        if self._revert_fg is not None:
+            self.status_label.config(foreground=self._revert_fg)
+            self._revert_fg = None
+    
+    def _set_colored_message(self, message: str, color: str, duration: float):
+        """Set a temporary message shown in the given color"""
+        if self._revert_fg is None:
+            self._revert_fg = self.status_label.cget('foreground')
+        self.status_label.config(foreground=color)
+        self.set_temporary_message(message, duration)
     
     def set_success_message(self, message: str, duration: float = 3.0):
         """Set a success message with green color"""
-        original_fg = self.status_label.cget('foreground')
-        self.status_label.config(foreground='green')
-        self.set_temporary_message(f"✅ {message}", duration)
-        
-        def revert_color():
-            time.sleep(duration)
-            self.status_label.config(foreground=original_fg)
-        
-        threading.Thread(target=revert_color, daemon=True).start()
+        self._set_colored_message(f"✅ {message}", 'green', duration)
     
     def set_error_message(self, message: str, duration: float = 5.0):
         """Set an error message with red color"""
-        original_fg = self.status_label.cget('foreground')
-        self.status_label.config(foreground='red')
-        self.set_temporary_message(f"❌ {message}", duration)
-        
-        def revert_color():
-            time.sleep(duration)
-            self.status_label.config(foreground=original_fg)
-        
-        threading.Thread(target=revert_color, daemon=True).start()
+        self._set_colored_message(f"❌ {message}", 'red', duration)
     
     def set_warning_message(self, message: str, duration: float = 4.0):
         """Set a warning message with orange color"""
-        original_fg = self.status_label.cget('foreground')
-        self.status_label.config(foreground='orange')
-        self.set_temporary_message(f"⚠️ {message}", duration)
-        
-        def revert_color():
-            time.sleep(duration)
-            self.status_label.config(foreground=original_fg)
-        
-        threading.Thread(target=revert_color, daemon=True).start()
+        self._set_colored_message(f"⚠️ {message}", 'orange', duration)
     
     def clear(self):
         """Clear the status bar"""
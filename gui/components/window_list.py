@@ -2,13 +2,42 @@
 Window list widget for selecting and ordering game windows
 """
 
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache, partial
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 from typing import List, Optional, Callable, Dict
 
 from models.game_window import GameWindow
 from models.profile import Profile
 
+# Glyphs drawn in the Select column
+CHECKED = "☑"
+UNCHECKED = "☐"
+
+# Icon shown before the game name; anything else gets the generic one
+_GAME_ICONS = {'dofus': "🎮", 'wakfu': "🏰"}
+
+# Vertical padding around the text of each row, in pixels
+ROW_PAD = 5
+
+
+@lru_cache(maxsize=512)
+def _name_matches(profile_name: str, current_name: str) -> bool:
+    """Fuzzy match two lowercased, stripped character names"""
+    # Check if one name contains the other
+    if profile_name in current_name or current_name in profile_name:
+        return True
+    
+    # Check if names are similar (common prefixes/suffixes)
+    if len(profile_name) > 3 and len(current_name) > 3:
+        return (profile_name.startswith(current_name[:3]) or 
+                current_name.startswith(profile_name[:3]))
+    
+    return False
+
 
 class WindowListWidget(ttk.Frame):
     """Custom widget for displaying and managing game windows"""
@@ -17,11 +46,49 @@ class WindowListWidget(ttk.Frame):
         super().__init__(parent)
         
         self.windows: List[GameWindow] = []
-        self.window_vars: List[tk.BooleanVar] = []
-        self.order_vars: List[tk.StringVar] = []
         self.on_selection_changed = on_selection_changed
         
+        # Per-row state keyed by window index (the row iid is str(index))
+        self._selected: Dict[int, bool] = {}
+        self._orders: Dict[int, str] = {}
+        
+        # How many rows hold each numeric order, and the lowest number that may be free
+        self._used_orders: Counter = Counter()
+        self._next_free = 1
+        
+        # Column texts computed once per set_windows, indexed like self.windows;
+        # tooltips are formatted on first hover
+        self._game_texts: List[str] = []
+        self._display_texts: List[str] = []
+        self._tooltip_texts: List[Optional[str]] = []
+        self._by_character_lc: Dict[str, GameWindow] = {}
+        
+        # Rows currently in the tree; refreshes reuse them instead of rebuilding
+        self._row_count = 0
+        
+        # Transient Entry overlaid on the Order cell while editing
+        self._order_editor: Optional[ttk.Entry] = None
+        self._editing_index = -1
+        
+        # Set while a bulk update runs so on_selection_changed fires once at the end
+        self._suspend_notify = False
+        
+        # Set while a notification is queued for the next idle moment
+        self._notify_pending = False
+        
+        # Fonts are resolved by Tk once and shared by every widget that uses them
+        self._font_plain = tkfont.Font(family='Segoe UI', size=9)
+        self._font_bold = tkfont.Font(family='Segoe UI', size=9, weight='bold')
+        self._font_empty = tkfont.Font(family='Segoe UI', size=11)
+        self._font_tooltip = tkfont.Font(family='Segoe UI', size=8)
+        
         self._create_widget()
+        
+        # One tooltip window shared by every row, built on the first hover
+        self._tooltip: Optional[tk.Toplevel] = None
+        self._tooltip_label: Optional[ttk.Label] = None
+        self._tooltip_row = ""
+        self._create_tooltip(self.tree)
     
     def _create_widget(self):
         """Create the widget layout"""
@@ -29,227 +96,395 @@ class WindowListWidget(ttk.Frame):
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
         
-        # Create scrollable area
-        self._create_scrollable_area()
+        # One Treeview draws every row instead of a frame of widgets per window
+        self._create_tree()
         
-        # Create header and empty state
-        self._create_header()
+        # Create empty state
+        self._create_empty_state()
         self._show_empty_state()
+        
+        # Mouse wheel scrolling
+        self._bind_mousewheel()
     
-    def _create_scrollable_area(self):
-        """Create scrollable canvas area"""
-        # Canvas and scrollbar
-        self.canvas = tk.Canvas(self, highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas)
+    def _create_tree(self):
+        """Create the Treeview with its columns and scrollbar"""
+        style = ttk.Style(self)
+        # Fixed row height measured once from the font, so Tk never sizes rows itself
+        self.row_height = self._font_plain.metrics('linespace') + 2 * ROW_PAD
+        style.configure('WindowList.Treeview', font=self._font_plain, rowheight=self.row_height)
+        style.configure('WindowList.Treeview.Heading', font=self._font_bold)
         
-        # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.tree = ttk.Treeview(self, columns=('sel', 'order', 'game', 'name'),
+                                 show='headings', selectmode='none',
+                                 style='WindowList.Treeview')
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
         
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        # Column headers
+        self.tree.heading('sel', text="Select")
+        self.tree.heading('order', text="Order")
+        self.tree.heading('game', text="Game", anchor=tk.W)
+        self.tree.heading('name', text="Character/Window", anchor=tk.W)
+        
+        self.tree.column('sel', width=60, minwidth=50, stretch=False, anchor=tk.CENTER)
+        self.tree.column('order', width=60, minwidth=50, stretch=False, anchor=tk.CENTER)
+        self.tree.column('game', width=110, minwidth=80, stretch=False, anchor=tk.W)
+        self.tree.column('name', width=300, minwidth=150, stretch=True, anchor=tk.W)
         
         # Grid layout
-        self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
-        # Mouse wheel scrolling
-        self._bind_mousewheel()
+        # Toggle on the Select cell, edit in place on the Order cell
+        self.tree.bind("<Button-1>", self._on_tree_click)
+        self.tree.bind("<Double-1>", self._on_tree_double_click)
     
-    def _bind_mousewheel(self):
-        """Bind mouse wheel scrolling"""
-        def on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        # Bind to canvas and all child widgets
-        def bind_to_mousewheel(widget):
-            widget.bind("<MouseWheel>", on_mousewheel)
-            for child in widget.winfo_children():
-                bind_to_mousewheel(child)
-        
-        bind_to_mousewheel(self.canvas)
+    def _create_empty_state(self):
+        """Create the empty state message shown over the list"""
+        self.empty_label = ttk.Label(self.tree, 
+                                     text="No game windows detected.\n\nMake sure Dofus or Wakfu is running\nand click 'Refresh Windows'.",
+                                     font=self._font_empty, foreground='gray', justify=tk.CENTER)
     
-    def _create_header(self):
-        """Create the column headers"""
-        self.header_frame = ttk.Frame(self.scrollable_frame)
-        self.header_frame.pack(fill=tk.X, padx=5, pady=(5, 10))
-        
-        # Column headers
-        ttk.Label(self.header_frame, text="Select", font=('Segoe UI', 9, 'bold')).grid(
-            row=0, column=0, padx=(10, 20), sticky=tk.W)
-        ttk.Label(self.header_frame, text="Order", font=('Segoe UI', 9, 'bold')).grid(
-            row=0, column=1, padx=(0, 20), sticky=tk.W)
-        ttk.Label(self.header_frame, text="Game", font=('Segoe UI', 9, 'bold')).grid(
-            row=0, column=2, padx=(0, 20), sticky=tk.W)
-        ttk.Label(self.header_frame, text="Character/Window", font=('Segoe UI', 9, 'bold')).grid(
-            row=0, column=3, padx=(0, 20), sticky=tk.W)
+    def _bind_mousewheel(self):
+        """Scroll the list with the wheel whenever the pointer is over it"""
+        self._yview_scroll = self.tree.yview_scroll
+        
+        # The tree handles its own wheel events and stops them there; the global
+        # binding only exists while the pointer is over the scrollbar or empty state
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", self._on_wheel_up)
+        self.tree.bind("<Button-5>", self._on_wheel_down)
+        
+        for widget in (self.tree, self.scrollbar, self.empty_label):
+            widget.bind("<Enter>", self._bind_mousewheel_all)
+            widget.bind("<Leave>", self._unbind_mousewheel_all)
+    
+    def _bind_mousewheel_all(self, event=None):
+        """Route wheel events to the list while the pointer is over it"""
+        self.tree.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind_all("<Button-4>", self._on_wheel_up)
+        self.tree.bind_all("<Button-5>", self._on_wheel_down)
+    
+    def _unbind_mousewheel_all(self, event=None):
+        """Stop routing wheel events once the pointer leaves the list"""
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.unbind_all(sequence)
+    
+    def _on_mousewheel(self, event):
+        """Scroll the list by one step per wheel notch"""
+        self._yview_scroll(-event.delta // 120, "units")
+        return "break"
+    
+    def _on_wheel_up(self, event):
+        """Scroll up one step (X11 wheel button 4)"""
+        self._yview_scroll(-1, "units")
+        return "break"
+    
+    def _on_wheel_down(self, event):
+        """Scroll down one step (X11 wheel button 5)"""
+        self._yview_scroll(1, "units")
+        return "break"
     
     def _show_empty_state(self):
         """Show empty state message"""
-        self.empty_frame = ttk.Frame(self.scrollable_frame)
-        self.empty_frame.pack(fill=tk.BOTH, expand=True, pady=50)
-        
-        empty_label = ttk.Label(self.empty_frame, 
-                               text="No game windows detected.\n\nMake sure Dofus or Wakfu is running\nand click 'Refresh Windows'.",
-                               font=('Segoe UI', 11), foreground='gray', justify=tk.CENTER)
-        empty_label.pack(expand=True)
+        self.empty_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+    
+    def _hide_empty_state(self):
+        """Hide empty state message"""
+        self.empty_label.place_forget()
     
     def set_windows(self, windows: List[GameWindow]):
         """Set the list of windows to display"""
         self.windows = windows.copy()
         self._clear_window_entries()
         
-        if not windows:
-            self._show_empty_state()
-            return
-        
-        # Hide empty state
-        if hasattr(self, 'empty_frame'):
-            self.empty_frame.destroy()
+        self._game_texts = [self._make_game_text(w) for w in self.windows]
+        self._display_texts = [self._make_display_text(w) for w in self.windows]
+        self._tooltip_texts = [None] * len(self.windows)
+        self._index_characters()
         
-        # Create window entries
-        self.window_vars = []
-        self.order_vars = []
-        
-        for i, window in enumerate(windows):
-            self._create_window_entry(window, i)
+        # Rewrite the rows that already exist, then add or drop only the difference
+        row_count = self._row_count
+        for i in range(len(self.windows)):
+            if i < row_count:
+                self._update_window_row(i)
+            else:
+                self._insert_window_row(i)
+        self._trim_rows(len(self.windows))
         
-        # Update scroll region
-        self.scrollable_frame.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        if not windows:
+            self._show_empty_state()
+        else:
+            self._hide_empty_state()
     
     def _clear_window_entries(self):
-        """Clear all window entries"""
-        # Destroy all children except header
-        for child in self.scrollable_frame.winfo_children():
-            if child != self.header_frame:
-                child.destroy()
-        
-        self.window_vars = []
-        self.order_vars = []
-    
-    def _create_window_entry(self, window: GameWindow, index: int):
-        """Create a single window entry"""
-        frame = ttk.Frame(self.scrollable_frame)
-        frame.pack(fill=tk.X, padx=5, pady=2)
-        
-        # Selection checkbox
-        var = tk.BooleanVar()
-        checkbox = ttk.Checkbutton(frame, variable=var, command=self._on_selection_change)
-        checkbox.grid(row=0, column=0, padx=(10, 20))
-        self.window_vars.append(var)
-        
-        # Order entry
-        order_var = tk.StringVar()
-        order_entry = ttk.Entry(frame, textvariable=order_var, width=5, 
-                               justify=tk.CENTER, state=tk.DISABLED)
-        order_entry.grid(row=0, column=1, padx=(0, 20))
-        self.order_vars.append(order_var)
-        
-        # Enable/disable order entry based on checkbox
-        def on_checkbox_change():
-            if var.get():
-                order_entry.config(state=tk.NORMAL)
-                if not order_var.get():
-                    # Auto-assign order number
-                    self._auto_assign_order(index)
-            else:
-                order_entry.config(state=tk.DISABLED)
-                order_var.set("")
-            
-            if self.on_selection_changed:
-                self.on_selection_changed()
-        
-        var.trace('w', lambda *args: on_checkbox_change())
-        order_var.trace('w', lambda *args: self._on_selection_change())
-        
-        # Game type with icon
-        game_icon = "🎮" if window.game_type == "dofus" else "🏰" if window.game_type == "wakfu" else "⚡"
-        game_text = f"{game_icon} {window.game_type.title()}"
-        game_label = ttk.Label(frame, text=game_text, font=('Segoe UI', 9, 'bold'))
-        game_label.grid(row=0, column=2, padx=(0, 20), sticky=tk.W)
-        
-        # Character/window name
+        """Reset the selection state of all window entries"""
+        self._close_order_editor(commit=False)
+        self._hide_tooltip()
+        self._selected = {}
+        self._orders = {}
+        self._used_orders = Counter()
+        self._next_free = 1
+    
+    def _trim_rows(self, count: int):
+        """Delete the rows past the first count"""
+        if self._row_count > count:
+            self.tree.delete(*[str(i) for i in range(count, self._row_count)])
+        self._row_count = count
+    
+    @staticmethod
+    def _make_game_text(window: GameWindow) -> str:
+        """Game type with icon"""
+        return f"{_GAME_ICONS.get(window.game_type, '⚡')} {window.game_type.title()}"
+    
+    @staticmethod
+    def _make_display_text(window: GameWindow) -> str:
+        """Character/window name, truncated to fit the column"""
         display_text = window.get_display_name()
         if len(display_text) > 60:
             display_text = display_text[:57] + "..."
+        return display_text
+    
+    def _row_values(self, index: int) -> tuple:
+        """Column values for an unselected window row"""
+        return (UNCHECKED, "", self._game_texts[index], self._display_texts[index])
+    
+    def _insert_window_row(self, index: int):
+        """Insert a single window row"""
+        self._selected[index] = False
+        self._orders[index] = ""
+        self.tree.insert('', 'end', iid=str(index), values=self._row_values(index))
+        self._row_count += 1
+    
+    def _update_window_row(self, index: int):
+        """Reuse an existing row for another window"""
+        self._selected[index] = False
+        self._orders[index] = ""
+        self.tree.item(str(index), values=self._row_values(index))
+    
+    def _on_tree_click(self, event):
+        """Toggle selection when the Select cell is clicked"""
+        if self.tree.identify_region(event.x, event.y) != 'cell':
+            return
+        if self.tree.identify_column(event.x) != '#1':
+            return
         
-        info_label = ttk.Label(frame, text=display_text, font=('Segoe UI', 9))
-        info_label.grid(row=0, column=3, sticky=tk.W)
+        iid = self.tree.identify_row(event.y)
+        if iid:
+            self._on_row_toggle(int(iid))
+    
+    def _on_tree_double_click(self, event):
+        """Open an in-place editor on the Order cell of a selected row"""
+        if self.tree.identify_region(event.x, event.y) != 'cell':
+            return
+        if self.tree.identify_column(event.x) != '#2':
+            return
         
-        # Add tooltip with full window information
-        self._create_tooltip(info_label, self._get_window_tooltip(window))
+        iid = self.tree.identify_row(event.y)
+        if iid and self._selected.get(int(iid)):
+            self._open_order_editor(int(iid))
     
-    def _create_tooltip(self, widget, text: str):
-        """Create a tooltip for a widget"""
-        def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            
-            label = ttk.Label(tooltip, text=text, background="lightyellow", 
-                             relief=tk.SOLID, borderwidth=1, font=('Segoe UI', 8),
-                             wraplength=300)
-            label.pack(padx=5, pady=5)
-            widget.tooltip = tooltip
+    def _open_order_editor(self, index: int):
+        """Overlay an Entry on the Order cell of a row"""
+        self._close_order_editor(commit=True)
+        
+        bbox = self.tree.bbox(str(index), 'order')
+        if not bbox:
+            return
+        x, y, width, height = bbox
+        
+        editor = ttk.Entry(self.tree, justify=tk.CENTER)
+        editor.insert(0, self._orders.get(index, ""))
+        editor.select_range(0, tk.END)
+        editor.place(x=x, y=y, width=width, height=height)
+        editor.focus_set()
+        
+        commit_edit = partial(self._close_order_editor, True)
+        editor.bind("<Return>", commit_edit)
+        editor.bind("<FocusOut>", commit_edit)
+        editor.bind("<Escape>", partial(self._close_order_editor, False))
+        
+        self._editing_index = index
+        self._order_editor = editor
+    
+    def _close_order_editor(self, commit: bool, event=None):
+        """Remove the order editor, storing its value when committing"""
+        editor = self._order_editor
+        if editor is None:
+            return
+        self._order_editor = None
+        
+        if commit:
+            self._on_order_edit(self._editing_index, editor.get().strip())
+        
+        editor.destroy()
+    
+    def _on_row_toggle(self, index: int):
+        """Handle a click on a row's Select cell"""
+        if self._suspend_notify or index not in self._selected:
+            return
+        self._set_row_selected(index, not self._selected[index])
+        self._on_selection_change()
+    
+    def _on_order_edit(self, index: int, order: str):
+        """Handle a committed edit of a row's Order cell"""
+        if self._suspend_notify or index not in self._orders:
+            return
+        self._set_row_order(index, order)
+        self._on_selection_change()
+    
+    def _set_row_selected(self, index: int, selected: bool):
+        """Set a row's selection state, assigning or clearing its order"""
+        self._selected[index] = selected
+        self.tree.set(str(index), 'sel', CHECKED if selected else UNCHECKED)
+        
+        if selected:
+            if not self._orders.get(index):
+                # Auto-assign order number
+                self._auto_assign_order(index)
+        else:
+            self._set_row_order(index, "")
+    
+    def _set_row_order(self, index: int, order: str):
+        """Set a row's order text"""
+        self._store_row_order(index, order)
+        self.tree.set(str(index), 'order', order)
+    
+    def _store_row_order(self, index: int, order: str):
+        """Record a row's order text and keep the used-order counts in step"""
+        old = self._orders.get(index, "")
+        if old.isdigit():
+            old_order = int(old)
+            self._used_orders[old_order] -= 1
+            if not self._used_orders[old_order]:
+                del self._used_orders[old_order]
+                if old_order < self._next_free:
+                    self._next_free = old_order
+        if order.isdigit():
+            self._used_orders[int(order)] += 1
+        
+        self._orders[index] = order
+    
+    def _create_tooltip(self, widget):
+        """Show the shared tooltip for the row under the pointer's Character cell"""
+        widget.bind("<Motion>", self._on_tooltip_motion)
+        widget.bind("<Leave>", self._hide_tooltip, add="+")
+    
+    def _on_tooltip_motion(self, event):
+        """Move the tooltip to the hovered row when the pointer changes rows"""
+        row = ""
+        if self.tree.identify_column(event.x) == '#4':
+            row = self.tree.identify_row(event.y)
+        if row == self._tooltip_row:
+            return
         
-        def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
+        self._tooltip_row = row
+        if not row or int(row) >= len(self.windows):
+            self._hide_tooltip()
+            return
         
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+        if self._tooltip is None:
+            self._build_tooltip()
+        
+        # Text is formatted only for rows that are actually hovered, then kept
+        index = int(row)
+        text = self._tooltip_texts[index]
+        if text is None:
+            text = self._tooltip_texts[index] = self._get_window_tooltip(self.windows[index])
+        self._tooltip_label.configure(text=text)
+        self._tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+        self._tooltip.deiconify()
+    
+    def _build_tooltip(self):
+        """Create the shared tooltip window, hidden"""
+        self._tooltip = tk.Toplevel(self)
+        self._tooltip.wm_overrideredirect(True)
+        self._tooltip.withdraw()
+        self._tooltip_label = ttk.Label(self._tooltip, background="lightyellow", 
+                                        relief=tk.SOLID, borderwidth=1, font=self._font_tooltip,
+                                        wraplength=300)
+        self._tooltip_label.pack(padx=5, pady=5)
+    
+    def _hide_tooltip(self, event=None):
+        """Hide the shared tooltip"""
+        self._tooltip_row = ""
+        if self._tooltip is not None:
+            self._tooltip.withdraw()
     
     def _get_window_tooltip(self, window: GameWindow) -> str:
         """Generate tooltip text for a window"""
-        tooltip = f"Game: {window.game_type.title()}\n"
-        tooltip += f"Character: {window.character_name}\n"
-        tooltip += f"Window Title: {window.title}\n"
-        tooltip += f"Process: {window.process_name} (PID: {window.process_id})\n"
-        tooltip += f"Window Handle: {window.hwnd}"
-        return tooltip
+        return (f"Game: {window.game_type.title()}\n"
+                f"Character: {window.character_name}\n"
+                f"Window Title: {window.title}\n"
+                f"Process: {window.process_name} (PID: {window.process_id})\n"
+                f"Window Handle: {window.hwnd}")
     
     def _auto_assign_order(self, index: int):
         """Auto-assign an order number to a window"""
-        # Find the next available order number
-        used_orders = set()
-        for order_var in self.order_vars:
-            if order_var.get().isdigit():
-                used_orders.add(int(order_var.get()))
-        
-        next_order = 1
-        while next_order in used_orders:
+        self._set_row_order(index, self._take_free_order())
+    
+    def _take_free_order(self) -> str:
+        """Find the next available order number"""
+        # Numbers below _next_free are all taken
+        next_order = max(self._next_free, 1)
+        while next_order in self._used_orders:
             next_order += 1
         
-        self.order_vars[index].set(str(next_order))
+        self._next_free = next_order + 1
+        return str(next_order)
     
     def _on_selection_change(self):
         """Handle selection changes"""
+        if not self._suspend_notify:
+            self._schedule_notify()
+    
+    def _schedule_notify(self):
+        """Queue one on_selection_changed call for when the event loop goes idle"""
+        if not self._notify_pending and self.on_selection_changed:
+            self._notify_pending = True
+            self.after_idle(self._fire_notify)
+    
+    def _fire_notify(self):
+        """Deliver the queued selection change notification"""
+        self._notify_pending = False
         if self.on_selection_changed:
             self.on_selection_changed()
     
+    @contextmanager
+    def _batch_update(self):
+        """Silence change notifications for the block and send a single one after it"""
+        if self._suspend_notify:
+            # Nested inside another bulk update, which notifies when it ends
+            yield
+            return
+        
+        self._suspend_notify = True
+        try:
+            yield
+        finally:
+            self._suspend_notify = False
+        self._on_selection_change()
+    
     def get_selected_windows(self) -> List[GameWindow]:
         """Get list of selected windows"""
         selected = []
-        for i, var in enumerate(self.window_vars):
-            if var.get() and i < len(self.windows):
+        for i, is_selected in self._selected.items():
+            if is_selected and i < len(self.windows):
                 selected.append(self.windows[i])
         return selected
     
     def get_selected_windows_with_order(self) -> List[GameWindow]:
         """Get selected windows with their order numbers set"""
         selected = []
+        windows = self.windows
+        orders = self._orders
         
-        for i, (window_var, order_var) in enumerate(zip(self.window_vars, self.order_vars)):
-            if window_var.get() and i < len(self.windows):
+        for i, is_selected in self._selected.items():
+            if is_selected and i < len(windows):
                 try:
-                    order = int(order_var.get())
+                    order = int(orders[i])
                     if order > 0:
-                        window = self.windows[i]
+                        window = windows[i]
                         window.order = order
                         selected.append(window)
                 except (ValueError, IndexError):
@@ -259,79 +494,95 @@ class WindowListWidget(ttk.Frame):
         selected.sort(key=lambda w: w.order)
         return selected
     
+    # Bulk updates change the dicts first, then rewrite each row with one Tk call
+    
     def clear_selection(self):
         """Clear all selections"""
-        for var in self.window_vars:
-            var.set(False)
-        for var in self.order_vars:
-            var.set("")
+        self._close_order_editor(commit=False)
+        self._selected = dict.fromkeys(self._selected, False)
+        self._orders = dict.fromkeys(self._orders, "")
+        self._used_orders = Counter()
+        self._next_free = 1
+        
+        self._refresh_rows()
+        self._on_selection_change()
     
     def select_all(self):
         """Select all windows"""
-        for var in self.window_vars:
-            var.set(True)
-        # Auto-assign orders will be triggered by the checkbox events
+        self._close_order_editor(commit=True)
+        selected = self._selected
+        for i, is_selected in selected.items():
+            if not is_selected:
+                selected[i] = True
+                if not self._orders[i]:
+                    self._store_row_order(i, self._take_free_order())
+        
+        self._refresh_rows()
+        self._on_selection_change()
     
     def auto_assign_orders(self):
         """Auto-assign order numbers to all selected windows"""
+        self._close_order_editor(commit=True)
         order = 1
-        for i, var in enumerate(self.window_vars):
-            if var.get():
-                self.order_vars[i].set(str(order))
+        for i, is_selected in self._selected.items():
+            if is_selected:
+                self._store_row_order(i, str(order))
                 order += 1
+        
+        self._refresh_rows()
+        self._on_selection_change()
     
     def apply_profile(self, profile: Profile) -> int:
         """Apply a profile to the current window list"""
-        # Clear current selection
-        self.clear_selection()
-        
         matched_count = 0
         
-        # Try to match profile windows with current windows
-        for profile_window in profile.windows:
-            for i, current_window in enumerate(self.windows):
-                # Match by character name first, then by title similarity
-                if self._windows_match(profile_window, current_window):
-                    self.window_vars[i].set(True)
-                    self.order_vars[i].set(str(profile_window.order))
-                    matched_count += 1
-                    break
+        # Lowercase every compared field once instead of on each pairwise test
+        current_keys = [self._match_key(w) for w in self.windows]
+        
+        with self._batch_update():
+            # Clear current selection
+            self.clear_selection()
+            
+            # Try to match profile windows with current windows
+            for profile_window in profile.windows:
+                profile_key = self._match_key(profile_window)
+                for i, current_key in enumerate(current_keys):
+                    # Match by character name first, then by title similarity
+                    if self._windows_match(profile_key, current_key):
+                        self._set_row_order(i, str(profile_window.order))
+                        self._set_row_selected(i, True)
+                        matched_count += 1
+                        break
         
         return matched_count
     
-    def _windows_match(self, profile_window, current_window: GameWindow) -> bool:
+    @staticmethod
+    def _match_key(window) -> tuple:
+        """Lowercased (name, stripped name, title, game type) used for profile matching"""
+        character_lc = (getattr(window, 'character_name', None) or '').lower()
+        title_lc = (getattr(window, 'title', None) or '').lower()
+        return (character_lc, character_lc.strip(), title_lc, getattr(window, 'game_type', None))
+    
+    @staticmethod
+    def _windows_match(profile_key: tuple, current_key: tuple) -> bool:
         """Check if a profile window matches a current window"""
+        profile_cn, profile_name, profile_title, profile_gt = profile_key
+        current_cn, current_name, current_title, current_gt = current_key
+        
         # Match by character name (preferred)
-        if (hasattr(profile_window, 'character_name') and profile_window.character_name and 
-            current_window.character_name and 
-            profile_window.character_name.lower() in current_window.character_name.lower()):
+        if profile_cn and current_cn and profile_cn in current_cn:
             return True
         
         # Match by title similarity
-        if hasattr(profile_window, 'title') and profile_window.title:
-            if (profile_window.title.lower() in current_window.title.lower() or 
-                current_window.title.lower() in profile_window.title.lower()):
+        if profile_title:
+            if profile_title in current_title or current_title in profile_title:
                 return True
         
         # Match by game type and partial name
-        if (hasattr(profile_window, 'game_type') and 
-            profile_window.game_type == current_window.game_type):
+        if profile_gt is not None and profile_gt == current_gt:
             # If same game type, check for any character name overlap
-            if (hasattr(profile_window, 'character_name') and profile_window.character_name and
-                current_window.character_name):
-                # Fuzzy matching for character names
-                profile_name = profile_window.character_name.lower().strip()
-                current_name = current_window.character_name.lower().strip()
-                
-                # Check if one name contains the other
-                if profile_name in current_name or current_name in profile_name:
-                    return True
-                
-                # Check if names are similar (common prefixes/suffixes)
-                if len(profile_name) > 3 and len(current_name) > 3:
-                    if (profile_name.startswith(current_name[:3]) or 
-                        current_name.startswith(profile_name[:3])):
-                        return True
+            if profile_cn and current_cn and _name_matches(profile_name, current_name):
+                return True
         
         return False
     
@@ -361,9 +612,9 @@ class WindowListWidget(ttk.Frame):
         
         # Check orders
         orders = []
-        for i, (window_var, order_var) in enumerate(zip(self.window_vars, self.order_vars)):
-            if window_var.get():
-                order_text = order_var.get().strip()
+        for i, is_selected in self._selected.items():
+            if is_selected:
+                order_text = self._orders.get(i, "").strip()
                 if not order_text:
                     errors.append(f"Window {i+1} is selected but has no order number")
                     continue
@@ -391,43 +642,54 @@ class WindowListWidget(ttk.Frame):
     
     def set_window_selected(self, index: int, selected: bool):
         """Set selection state for a specific window"""
-        if 0 <= index < len(self.window_vars):
-            self.window_vars[index].set(selected)
+        if index in self._selected:
+            self._set_row_selected(index, selected)
+            self._on_selection_change()
     
     def set_window_order(self, index: int, order: int):
         """Set order for a specific window"""
-        if 0 <= index < len(self.order_vars):
-            self.order_vars[index].set(str(order))
+        if index in self._orders:
+            self._set_row_order(index, str(order))
+            self._on_selection_change()
     
     def get_statistics(self) -> Dict[str, int]:
         """Get statistics about the current window list"""
-        total_windows = len(self.windows)
-        selected_windows = len(self.get_selected_windows())
-        
-        game_counts = {}
+        # Single pass over the windows instead of one traversal per counter
+        dofus_windows = wakfu_windows = 0
+        characters = set()
         for window in self.windows:
             game_type = window.game_type
-            game_counts[game_type] = game_counts.get(game_type, 0) + 1
+            if game_type == 'dofus':
+                dofus_windows += 1
+            elif game_type == 'wakfu':
+                wakfu_windows += 1
+            if window.character_name:
+                characters.add(window.character_name)
         
         return {
-            'total_windows': total_windows,
-            'selected_windows': selected_windows,
-            'dofus_windows': game_counts.get('dofus', 0),
-            'wakfu_windows': game_counts.get('wakfu', 0),
-            'unique_characters': len(set(w.character_name for w in self.windows if w.character_name))
+            'total_windows': len(self.windows),
+            'selected_windows': self.get_selection_count(),
+            'dofus_windows': dofus_windows,
+            'wakfu_windows': wakfu_windows,
+            'unique_characters': len(characters)
         }
     
     def refresh_display(self):
         """Refresh the display without changing the window list"""
-        self.scrollable_frame.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # Rows have a fixed height, so the scroll position is known without a relayout
+        self.scrollbar.set(*self.tree.yview())
     
     def get_window_by_character(self, character_name: str) -> Optional[GameWindow]:
         """Find a window by character name"""
+        return self._by_character_lc.get(character_name.lower())
+    
+    def _index_characters(self):
+        """Map each lowercased character name to its first window in list order"""
+        by_character_lc = {}
         for window in self.windows:
-            if window.character_name.lower() == character_name.lower():
-                return window
-        return None
+            if window.character_name:
+                by_character_lc.setdefault(window.character_name.lower(), window)
+        self._by_character_lc = by_character_lc
     
     def get_selected_character_names(self) -> List[str]:
         """Get list of selected character names"""
@@ -436,36 +698,39 @@ class WindowListWidget(ttk.Frame):
     
     def has_selection(self) -> bool:
         """Check if any windows are selected"""
-        return any(var.get() for var in self.window_vars)
+        return any(self._selected.values())
     
     def get_selection_count(self) -> int:
         """Get number of selected windows"""
-        return sum(1 for var in self.window_vars if var.get())
+        return sum(self._selected.values())
     
     def sort_windows_by_character(self):
         """Sort windows by character name"""
         if not self.windows:
             return
         
-        # Sort windows while preserving current selection
-        selected_indices = [i for i, var in enumerate(self.window_vars) if var.get()]
-        selected_orders = [self.order_vars[i].get() for i in selected_indices]
+        self._close_order_editor(commit=True)
         
-        # Sort windows by character name
-        sorted_pairs = sorted(enumerate(self.windows), key=lambda x: x[1].character_name.lower())
-        sorted_windows = [pair[1] for pair in sorted_pairs]
-        old_to_new_index = {old_idx: new_idx for new_idx, (old_idx, _) in enumerate(sorted_pairs)}
+        # Permute the data in place of rebuilding the rows; selection moves with it
+        windows = self.windows
+        perm = sorted(range(len(windows)), key=lambda i: windows[i].character_name.lower())
         
-        # Update windows list
-        self.windows = sorted_windows
+        self.windows = [windows[i] for i in perm]
+        self._game_texts = [self._game_texts[i] for i in perm]
+        self._display_texts = [self._display_texts[i] for i in perm]
+        self._tooltip_texts = [self._tooltip_texts[i] for i in perm]
+        self._index_characters()
+        self._selected = {new: self._selected[old] for new, old in enumerate(perm)}
+        self._orders = {new: self._orders[old] for new, old in enumerate(perm)}
         
-        # Recreate the display
-        self.set_windows(self.windows)
+        self._refresh_rows()
+        self._on_selection_change()
+    
+    def _refresh_rows(self):
+        """Rewrite every existing row from the current data"""
+        self._hide_tooltip()
         
-        # Restore selection with new indices
-        for old_idx, order in zip(selected_indices, selected_orders):
-            if old_idx in old_to_new_index:
-                new_idx = old_to_new_index[old_idx]
-                if new_idx < len(self.window_vars):
-                    self.window_vars[new_idx].set(True)
-                    self.order_vars[new_idx].set(order)
\ No newline at end of file
+        item = self.tree.item
+        for i in range(len(self.windows)):
+            item(str(i), values=(CHECKED if self._selected[i] else UNCHECKED, self._orders[i],
+                                 self._game_texts[i], self._display_texts[i]))
@@ -5,20 +5,92 @@ Hotkey configuration dialog with live capture and preset options
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
-import time
+from functools import partial
 from typing import Optional
 
 from models.hotkey import HotkeyConfig, HotkeyValidator, KEYBOARD_PRESETS, MOUSE_PRESETS
 
+# Preset button grids as (display, value, row, column), laid out five per row
+_KB_GRID = [(d, v, i // 5, i % 5) for i, (d, v) in enumerate(KEYBOARD_PRESETS)]
+_MOUSE_GRID = [(d, v, i // 5, i % 5) for i, (d, v) in enumerate(MOUSE_PRESETS)]
+_PRESET_BUTTON_OPTIONS = {'width': 12}
+
+# Live capture through Tk events (Windows event.state bits for Ctrl/Alt/Shift)
+_CAPTURE_TIMEOUT_MS = 10000
+
+# Rapid Test/Set clicks within this window collapse into one validation
+_CUSTOM_DEBOUNCE_MS = 200
+_TK_STATE_MODIFIERS = (('ctrl', 0x4), ('alt', 0x20000), ('shift', 0x1))
+_TK_MODIFIER_KEYSYMS = frozenset({
+    'Control_L', 'Control_R', 'Alt_L', 'Alt_R', 'Shift_L', 'Shift_R', 'Win_L', 'Win_R'
+})
+_TK_KEYSYM_NAMES = {'return': 'enter', 'prior': 'pageup', 'next': 'pagedown'}
+_TK_CAPTURE_BUTTONS = (('<Button-2>', 'middle'), ('<Button-4>', 'mouse4'), ('<Button-5>', 'mouse5'))
+
+# Modifier bits tracked by the pynput capture fallback, in canonical order
+_MOD_NAMES = ((1, 'ctrl'), (2, 'alt'), (4, 'shift'))
+
+# pynput is imported once at load so starting a capture only starts the listeners
+try:
+    from pynput import keyboard as _pynput_keyboard, mouse as _pynput_mouse
+    
+    _HAS_PYNPUT = True
+    _PN_KEY_TYPES = (_pynput_keyboard.KeyCode, _pynput_keyboard.Key)
+    _PN_MOD_BITS = {
+        _pynput_keyboard.Key.ctrl_l: 1, _pynput_keyboard.Key.ctrl_r: 1,
+        _pynput_keyboard.Key.alt_l: 2, _pynput_keyboard.Key.alt_r: 2,
+        _pynput_keyboard.Key.shift_l: 4, _pynput_keyboard.Key.shift_r: 4,
+    }
+    # Side buttons are x1/x2 on win32 and button8/button9 on xorg; darwin has neither
+    _Button = _pynput_mouse.Button
+    _PN_BUTTONS = {
+        button: name for button, name in (
+            (getattr(_Button, 'middle', None), 'middle'),
+            (getattr(_Button, 'x1', None) or getattr(_Button, 'button8', None), 'mouse4'),
+            (getattr(_Button, 'x2', None) or getattr(_Button, 'button9', None), 'mouse5'),
+        ) if button is not None
+    }
+    del _Button
+except ImportError:
+    _HAS_PYNPUT = False
+    _PN_KEY_TYPES = ()
+    _PN_MOD_BITS = {}
+    _PN_BUTTONS = {}
+
 
 class HotkeyConfigDialog:
     """Dialog for configuring hotkeys with multiple input methods"""
     
+    DEFAULT_HOTKEY = HotkeyConfig.parse("ctrl+tab")
+    
     def __init__(self, parent, current_hotkey: HotkeyConfig):
         self.parent = parent
         self.current_hotkey = current_hotkey
         self.result: Optional[HotkeyConfig] = None
         
+        # Tk-based live capture state
+        self._cap_pressed = set()
+        self._cap_keys = []
+        self._cap_timeout_id = None
+        
+        # pynput fallback: listeners installed on first capture and kept until the
+        # dialog closes; callbacks only record input while the event is set
+        self._capture_event = threading.Event()
+        self._capture_lock = threading.Lock()
+        self._kb_listener = None
+        self._mouse_listener = None
+        self._pn_pressed = set()
+        self._pn_mask = 0
+        self._pn_keys = []
+        self._pn_timeout_id = None
+        
+        # Pending debounced Test/Set of the custom hotkey entry
+        self._test_after_id = None
+        self._set_after_id = None
+        
+        # Parse every preset up front so a preset click is just a lookup
+        self._preset_cache = {v: HotkeyConfig.parse(v) for _, v in KEYBOARD_PRESETS + MOUSE_PRESETS}
+        
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("🔧 Configure Hotkey")
@@ -26,6 +98,7 @@ class HotkeyConfigDialog:
         self.dialog.transient(parent)
         self.dialog.grab_set()
         self.dialog.resizable(False, False)
+        self.dialog.bind('<Destroy>', self._on_dialog_destroy, add='+')
         
         # Center dialog
         self._center_dialog()
@@ -95,7 +168,7 @@ class HotkeyConfigDialog:
         # Show hotkey details
         details_text = f"Type: {self.current_hotkey.hotkey_type.value.title()}"
         if self.current_hotkey.modifiers:
-            details_text += f" | Modifiers: {', '.join(m.value.title() for m in self.current_hotkey.modifiers)}"
+            details_text += f" | Modifiers: {self.current_hotkey.modifier_names}"
         details_text += f" | Key: {self.current_hotkey.main_key}"
         
         details_label = ttk.Label(current_frame, text=details_text, 
@@ -108,13 +181,7 @@ class HotkeyConfigDialog:
         keyboard_frame.pack(fill=tk.X, pady=(0, 15))
         
         # Create grid of preset buttons
-        for i, (display, value) in enumerate(KEYBOARD_PRESETS):
-            row = i // 5
-            col = i % 5
-            
-            btn = ttk.Button(keyboard_frame, text=display, width=12,
-                           command=lambda v=value, d=display: self._set_preset_hotkey(v, d))
-            btn.grid(row=row, column=col, padx=3, pady=3)
+        self._create_preset_grid(keyboard_frame, _KB_GRID)
     
     def _create_mouse_presets(self, parent):
         """Create mouse preset buttons"""
@@ -122,12 +189,13 @@ class HotkeyConfigDialog:
         mouse_frame.pack(fill=tk.X, pady=(0, 15))
         
         # Create grid of mouse preset buttons
-        for i, (display, value) in enumerate(MOUSE_PRESETS):
-            row = i // 5
-            col = i % 5
-            
-            btn = ttk.Button(mouse_frame, text=display, width=12,
-                           command=lambda v=value, d=display: self._set_preset_hotkey(v, d))
+        self._create_preset_grid(mouse_frame, _MOUSE_GRID)
+    
+    def _create_preset_grid(self, frame, grid):
+        """Create one button per precomputed preset grid cell"""
+        for display, value, row, col in grid:
+            btn = ttk.Button(frame, text=display, **_PRESET_BUTTON_OPTIONS,
+                             command=partial(self._set_preset_hotkey, value, display))
             btn.grid(row=row, column=col, padx=3, pady=3)
     
     def _create_custom_input_section(self, parent):
@@ -150,10 +218,10 @@ class HotkeyConfigDialog:
         input_frame = ttk.Frame(custom_frame)
         input_frame.pack(fill=tk.X)
         
-        self.custom_var = tk.StringVar(value=self.current_hotkey.raw_value)
-        custom_entry = ttk.Entry(input_frame, textvariable=self.custom_var, 
-                                font=('Segoe UI', 10), width=25)
-        custom_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        # Read on demand when Test/Set is clicked, so no variable trace is needed
+        self.custom_entry = ttk.Entry(input_frame, font=('Segoe UI', 10), width=25)
+        self.custom_entry.insert(0, self.current_hotkey.raw_value)
+        self.custom_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         
         test_btn = ttk.Button(input_frame, text="🧪 Test", 
                              command=self._test_custom_hotkey)
@@ -180,6 +248,12 @@ class HotkeyConfigDialog:
         self.capture_result = ttk.Label(capture_frame, text="", 
                                        font=('Segoe UI', 10, 'bold'))
         self.capture_result.pack()
+        
+        # Outside Windows capture relies on pynput's global hooks
+        if not _HAS_PYNPUT and self.dialog.tk.call('tk', 'windowingsystem') != 'win32':
+            self.capture_button.config(state=tk.DISABLED)
+            self.capture_result.config(text="Live capture unavailable: pynput not installed",
+                                       foreground="gray")
     
     def _create_buttons(self, parent):
         """Create bottom buttons"""
@@ -199,16 +273,30 @@ class HotkeyConfigDialog:
     
     def _set_preset_hotkey(self, hotkey_value: str, display_name: str):
         """Set a preset hotkey"""
-        try:
-            config = HotkeyConfig.parse(hotkey_value)
-            self.result = config
-            self.dialog.destroy()
-        except Exception as e:
-            messagebox.showerror("Error", f"Invalid preset hotkey: {e}", parent=self.dialog)
+        config = self._preset_cache.get(hotkey_value)
+        if config is None:
+            try:
+                config = HotkeyConfig.parse(hotkey_value)
+            except Exception as e:
+                messagebox.showerror("Error", f"Invalid preset hotkey: {e}", parent=self.dialog)
+                return
+        
+        self.result = config
+        self.dialog.destroy()
     
     def _test_custom_hotkey(self):
-        """Test custom hotkey input"""
-        hotkey_text = self.custom_var.get().strip()
+        """Test custom hotkey input once clicks settle"""
+        if self._test_after_id is not None:
+            self.dialog.after_cancel(self._test_after_id)
+        self._test_after_id = self.dialog.after(_CUSTOM_DEBOUNCE_MS, self._do_test_custom_hotkey)
+    
+    def _do_test_custom_hotkey(self):
+        """Validate the custom hotkey input and report the result"""
+        self._test_after_id = None
+        if not self.dialog.winfo_exists():
+            return
+        
+        hotkey_text = self.custom_entry.get().strip()
         
         if not hotkey_text:
             messagebox.showwarning("Empty Input", "Please enter a hotkey combination to test.", 
@@ -226,8 +314,18 @@ class HotkeyConfigDialog:
                               parent=self.dialog)
     
     def _set_custom_hotkey(self):
-        """Set custom hotkey"""
-        hotkey_text = self.custom_var.get().strip()
+        """Set custom hotkey once clicks settle"""
+        if self._set_after_id is not None:
+            self.dialog.after_cancel(self._set_after_id)
+        self._set_after_id = self.dialog.after(_CUSTOM_DEBOUNCE_MS, self._do_set_custom_hotkey)
+    
+    def _do_set_custom_hotkey(self):
+        """Validate the custom hotkey input and close with it"""
+        self._set_after_id = None
+        if not self.dialog.winfo_exists():
+            return
+        
+        hotkey_text = self.custom_entry.get().strip()
         
         if not hotkey_text:
             messagebox.showwarning("Empty Input", "Please enter a hotkey combination.", 
@@ -252,125 +350,228 @@ class HotkeyConfigDialog:
         self.capture_button.config(text="🎤 Press your hotkey now...", state=tk.DISABLED)
         self.capture_result.config(text="Waiting for input...", foreground="orange")
         
-        # Start capture in background thread
-        capture_thread = threading.Thread(target=self._capture_thread, daemon=True)
-        capture_thread.start()
+        dialog = self.dialog
+        
+        # On X11 buttons 4/5 are the scroll wheel, so fall back to pynput's global hooks there
+        if dialog.tk.call('tk', 'windowingsystem') != 'win32':
+            self._start_pynput_capture()
+            return
+        
+        # Capture from the dialog's own events on the UI thread
+        self._cap_pressed = set()
+        self._cap_keys = []
+        bind = dialog.bind
+        on_button = self._on_cap_button
+        bind('<KeyPress>', self._on_cap_press)
+        bind('<KeyRelease>', self._on_cap_release)
+        for sequence, button_name in _TK_CAPTURE_BUTTONS:
+            bind(sequence, partial(on_button, button_name))
+        self._cap_timeout_id = dialog.after(_CAPTURE_TIMEOUT_MS, self._on_cap_timeout)
+    
+    @staticmethod
+    def _cap_modifiers(state: int) -> list:
+        """Modifier names held according to a Tk event state"""
+        return [name for name, bit in _TK_STATE_MODIFIERS if state & bit]
+    
+    def _on_cap_press(self, event):
+        """Record a key press during Tk capture"""
+        keysym = event.keysym
+        # Held keys are tracked by keycode: the keysym changes with Shift ('J' vs 'j')
+        self._cap_pressed.add(event.keycode)
+        
+        # The first non-modifier key completes the combination
+        if not self._cap_keys and keysym not in _TK_MODIFIER_KEYSYMS:
+            key_name = keysym.lower()
+            self._cap_keys = self._cap_modifiers(event.state) + [_TK_KEYSYM_NAMES.get(key_name, key_name)]
+        return "break"
+    
+    def _on_cap_release(self, event):
+        """Finish Tk capture once every key of the combination is released"""
+        self._cap_pressed.discard(event.keycode)
+        if not self._cap_pressed and self._cap_keys:
+            self._finish_tk_capture(self._cap_keys)
+        return "break"
     
-    def _capture_thread(self):
-        """Background thread for hotkey capture"""
+    def _on_cap_button(self, button_name: str, event):
+        """Finish Tk capture on an extra mouse button"""
+        self._finish_tk_capture(self._cap_modifiers(event.state) + [button_name])
+        return "break"
+    
+    def _on_cap_timeout(self):
+        """End Tk capture after the timeout, keeping any combination already pressed"""
+        self._cap_timeout_id = None
+        self._finish_tk_capture(self._cap_keys)
+    
+    def _finish_tk_capture(self, captured_keys):
+        """Remove the Tk capture bindings and report the result"""
+        for sequence in ('<KeyPress>', '<KeyRelease>'):
+            self.dialog.unbind(sequence)
+        for sequence, _ in _TK_CAPTURE_BUTTONS:
+            self.dialog.unbind(sequence)
+        if self._cap_timeout_id is not None:
+            self.dialog.after_cancel(self._cap_timeout_id)
+            self._cap_timeout_id = None
+        
+        self._capture_complete(captured_keys)
+    
+    def _start_pynput_capture(self):
+        """Arm the shared pynput listeners for one capture (non-Windows fallback)"""
         try:
-            # Import pynput for capture
-            import pynput.keyboard as pynput_keyboard
-            import pynput.mouse as pynput_mouse
-            
-            captured_keys = []
-            pressed_keys = set()
-            capture_timeout = 10.0  # 10 second timeout
-            
-            def on_press(key):
-                pressed_keys.add(key)
-            
-            def on_release(key):
-                if key in pressed_keys:
-                    pressed_keys.remove(key)
-                
-                # If all keys released and we have a combination, stop
-                if not pressed_keys and captured_keys:
-                    return False
-            
-            def on_click(x, y, button, pressed):
-                if pressed:
-                    if button == pynput_mouse.Button.middle:
-                        captured_keys.append('middle')
-                    elif button == pynput_mouse.Button.x1:
-                        captured_keys.append('mouse4')
-                    elif button == pynput_mouse.Button.x2:
-                        captured_keys.append('mouse5')
-                    return False  # Stop on mouse click
-            
-            # Start listeners
-            keyboard_listener = pynput_keyboard.Listener(on_press=on_press, on_release=on_release)
-            mouse_listener = pynput_mouse.Listener(on_click=on_click)
-            
-            keyboard_listener.start()
-            mouse_listener.start()
-            
-            # Wait for capture with timeout
-            start_time = time.time()
-            while (keyboard_listener.running or mouse_listener.running) and (time.time() - start_time < capture_timeout):
-                time.sleep(0.1)
-                
-                # Check for keyboard combination
-                if pressed_keys and not captured_keys:
-                    modifiers = []
-                    main_key = None
-                    
-                    for key in pressed_keys:
-                        if key == pynput_keyboard.Key.ctrl_l or key == pynput_keyboard.Key.ctrl_r:
-                            modifiers.append('ctrl')
-                        elif key == pynput_keyboard.Key.alt_l or key == pynput_keyboard.Key.alt_r:
-                            modifiers.append('alt')
-                        elif key == pynput_keyboard.Key.shift_l or key == pynput_keyboard.Key.shift_r:
-                            modifiers.append('shift')
-                        elif hasattr(key, 'char') and key.char:
-                            main_key = key.char.lower()
-                        elif hasattr(key, 'name'):
-                            main_key = key.name.lower()
-                    
-                    if main_key:
-                        captured_keys = list(set(modifiers)) + [main_key]
-            
-            # Clean up listeners
-            try:
-                keyboard_listener.stop()
-                mouse_listener.stop()
-            except:
-                pass
-            
-            # Update UI in main thread
-            self.dialog.after(0, self._capture_complete, captured_keys)
-            
+            self._ensure_capture_listeners()
         except Exception as e:
-            self.dialog.after(0, self._capture_error, str(e))
+            self._capture_error(str(e))
+            return
+        
+        self._pn_pressed = set()
+        self._pn_mask = 0
+        self._pn_keys = []
+        self._capture_event.set()
+        self._pn_timeout_id = self.dialog.after(_CAPTURE_TIMEOUT_MS, self._stop_capture)
+    
+    def _ensure_capture_listeners(self):
+        """Install the keyboard and mouse listeners once per dialog"""
+        if self._kb_listener is not None:
+            return
+        
+        self._kb_listener = _pynput_keyboard.Listener(on_press=self._on_pn_press,
+                                                      on_release=self._on_pn_release)
+        self._mouse_listener = _pynput_mouse.Listener(on_click=self._on_pn_click)
+        self._kb_listener.start()
+        self._mouse_listener.start()
+    
+    def _pn_held_modifiers(self) -> list:
+        """Modifier names currently held according to the pynput bitmask"""
+        return [name for bit, name in _MOD_NAMES if self._pn_mask & bit]
+    
+    def _on_pn_press(self, key):
+        """pynput key press: the first non-modifier key completes the combination"""
+        if not self._capture_event.is_set():
+            return
+        
+        self._pn_pressed.add(key)
+        bit = _PN_MOD_BITS.get(key, 0)
+        self._pn_mask |= bit
+        if self._pn_keys or bit:
+            return
+        
+        # Character keys are KeyCodes, special keys are Key members
+        KeyCode, Key = _PN_KEY_TYPES
+        if isinstance(key, KeyCode):
+            if not key.char:
+                return
+            main_key = key.char.lower()
+        elif isinstance(key, Key):
+            main_key = key.name.lower()
+        else:
+            return
+        self._pn_keys = self._pn_held_modifiers() + [main_key]
+    
+    def _on_pn_release(self, key):
+        """pynput key release: finish once every key of the combination is up"""
+        if not self._capture_event.is_set():
+            return
+        
+        self._pn_pressed.discard(key)
+        self._pn_mask &= ~_PN_MOD_BITS.get(key, 0)
+        if not self._pn_pressed and self._pn_keys:
+            self._finish_pynput_capture(self._pn_keys)
+    
+    def _on_pn_click(self, x, y, button, pressed):
+        """pynput mouse click: an extra button completes the combination"""
+        if not pressed or not self._capture_event.is_set():
+            return
+        
+        button_name = _PN_BUTTONS.get(button)
+        if button_name and not self._pn_keys:
+            self._finish_pynput_capture(self._pn_held_modifiers() + [button_name])
+    
+    def _take_capture(self) -> bool:
+        """Disarm the listeners; only the first caller gets to report a result"""
+        with self._capture_lock:
+            if not self._capture_event.is_set():
+                return False
+            self._capture_event.clear()
+            return True
+    
+    def _finish_pynput_capture(self, captured_keys):
+        """Hand a completed capture from a listener thread to the UI thread"""
+        if self._take_capture():
+            self.dialog.after_idle(self._stop_capture, list(captured_keys))
+    
+    def _stop_capture(self, captured_keys=None):
+        """End a pynput capture on the UI thread, either completed or timed out"""
+        if captured_keys is None:
+            # Timeout; a listener may have completed the capture just before
+            self._pn_timeout_id = None
+            if not self._take_capture():
+                return
+            # Report a combination that was pressed but never fully released
+            captured_keys = list(self._pn_keys)
+        elif self._pn_timeout_id is not None:
+            self.dialog.after_cancel(self._pn_timeout_id)
+            self._pn_timeout_id = None
+        
+        self._capture_complete(captured_keys)
+    
+    def _on_dialog_destroy(self, event):
+        """Cancel pending timers and uninstall the capture listeners when the dialog closes"""
+        if event.widget is not self.dialog:
+            return
+        
+        # Tkinter deletes the callbacks with the dialog, so a timer left to fire
+        # would raise "invalid command name" in the background
+        for attr in ('_cap_timeout_id', '_pn_timeout_id', '_test_after_id', '_set_after_id'):
+            after_id = getattr(self, attr)
+            if after_id is not None:
+                self.dialog.after_cancel(after_id)
+                setattr(self, attr, None)
+        
+        self._capture_event.clear()
+        for listener in (self._kb_listener, self._mouse_listener):
+            if listener is not None:
+                listener.stop()
+        self._kb_listener = self._mouse_listener = None
     
     def _capture_complete(self, captured_keys):
         """Handle capture completion"""
+        hotkey_str = None
         if captured_keys:
             hotkey_str = '+'.join(captured_keys)
             try:
                 config = HotkeyConfig.parse(hotkey_str)
-                display_str = config.display_name
-                
-                self.capture_result.config(text=f"Captured: {display_str}", foreground="green")
-                self.custom_var.set(hotkey_str)
-                
+                text, color = f"Captured: {config.display_name}", "green"
             except Exception as e:
-                self.capture_result.config(text=f"Invalid combination: {e}", foreground="red")
+                text, color = f"Invalid combination: {e}", "red"
+                hotkey_str = None
         else:
-            self.capture_result.config(text="No hotkey captured (timeout)", foreground="red")
+            text, color = "No hotkey captured (timeout)", "red"
         
-        # Re-enable button
-        self.capture_button.config(text="🎤 Click & Press Keys", state=tk.NORMAL)
+        self.dialog.after_idle(self._apply_capture_result, text, color, hotkey_str)
     
     def _capture_error(self, error_msg):
         """Handle capture error"""
-        self.capture_result.config(text=f"Capture failed: {error_msg}", foreground="red")
+        self.dialog.after_idle(self._apply_capture_result, f"Capture failed: {error_msg}", "red", None)
+    
+    def _apply_capture_result(self, text: str, color: str, hotkey_str: Optional[str]):
+        """Apply every widget change for a finished capture in one idle pass"""
+        # All capture UI updates go through after_idle so Tk folds them into one redraw
+        self.capture_result.config(text=text, foreground=color)
+        if hotkey_str is not None:
+            entry = self.custom_entry
+            entry.delete(0, tk.END)
+            entry.insert(0, hotkey_str)
+        
+        # Re-enable button
         self.capture_button.config(text="🎤 Click & Press Keys", state=tk.NORMAL)
     
     def _reset_to_default(self):
         """Reset to default hotkey"""
-        try:
-            default_config = HotkeyConfig.parse("ctrl+tab")
-            self.result = default_config
-            self.dialog.destroy()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to reset: {e}", parent=self.dialog)
+        self.result = self.DEFAULT_HOTKEY
+        self.dialog.destroy()
     
     def _ok(self):
         """OK button handler"""
-        # Use current hotkey if no new one was set
-        if self.result is None:
-            self.result = self.current_hotkey
+        # Leave result unset: closing without picking a hotkey is not a change
         self.dialog.destroy()
     
     def _cancel(self):
@@ -379,6 +580,8 @@ class HotkeyConfigDialog:
         self.dialog.destroy()
     
     def show(self) -> Optional[HotkeyConfig]:
-        """Show the dialog and return the result"""
+        """Show the dialog and return the new hotkey, or None if it was not changed"""
         self.dialog.wait_window()
+        if self.result == self.current_hotkey:
+            return None
         return self.result
\ No newline at end of file
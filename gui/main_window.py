@@ -4,6 +4,7 @@ Main application window and GUI controller
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import queue
 import threading
 from typing import List, Optional
 
@@ -18,6 +19,9 @@ from gui.profile_dialog import ProfileManagerDialog
 from gui.components.window_list import WindowListWidget
 from gui.components.status_bar import StatusBarWidget
 
+# How often the UI thread checks for a finished background window scan
+_SCAN_POLL_MS = 50
+
 
 class WindowCyclerApp:
     """Main application window and controller"""
@@ -30,6 +34,12 @@ class WindowCyclerApp:
         
         # GUI state
         self.detected_windows: List[GameWindow] = []
+        
+        # Window scans run on a worker thread that hands its result back through a
+        # queue polled by the UI thread; a refresh requested mid-scan reruns once
+        self._scan_running = False
+        self._rescan_requested = False
+        self._scan_results: queue.Queue = queue.Queue()
         self.current_hotkey = HotkeyConfig.parse("ctrl+tab")
         
         # Create main window
@@ -47,8 +57,8 @@ class WindowCyclerApp:
         # Set up callbacks
         self._setup_callbacks()
         
-        # Initial window detection
-        self.refresh_windows()
+        # Initial window detection, once the event loop is running
+        self.root.after_idle(self.refresh_windows)
     
     def _load_settings(self):
         """Load application settings"""
@@ -217,37 +227,75 @@ class WindowCyclerApp:
     
     def refresh_windows(self):
         """Refresh the list of detected game windows"""
+        if self._scan_running:
+            self._rescan_requested = True
+            return
+        
+        # Show loading in status; the scan itself runs off the UI thread
+        self._scan_running = True
+        self.status_bar.set_message("🔍 Scanning for game windows...")
+        threading.Thread(target=self._do_scan, daemon=True).start()
+        self.root.after(_SCAN_POLL_MS, self._poll_scan)
+    
+    def _do_scan(self):
+        """Enumerate game windows on a worker thread and queue the outcome for the UI"""
+        # No Tk calls here: the UI thread picks the result up in _poll_scan
         try:
-            # Show loading in status
-            self.status_bar.set_message("🔍 Scanning for game windows...")
-            self.root.update()
-            
-            # Detect windows
-            self.detected_windows = self.detector.get_all_game_windows()
-            
-            # Update display
-            self.window_list.set_windows(self.detected_windows)
-            
-            # Update statistics
-            self._update_statistics()
-            
-            # Update status
-            if self.detected_windows:
-                self.status_bar.set_message(f"Found {len(self.detected_windows)} game windows")
-            else:
-                self.status_bar.set_message("No Dofus/Wakfu windows detected - make sure games are running")
-            
+            # Every refresh is a real rescan; the detector's short-lived cache only
+            # shares this one enumeration between the window list and the stats
+            self.detector.invalidate()
+            windows = self.detector.get_all_game_windows()
+            stats = self.detector.get_game_statistics()
+            self._scan_results.put((self._apply_scan_results, (windows, stats)))
         except Exception as e:
-            self.status_bar.set_message(f"Error scanning windows: {e}")
-            messagebox.showerror("Error", f"Failed to scan for game windows:\n{e}")
+            self._scan_results.put((self._apply_scan_error, (e,)))
+    
+    def _poll_scan(self):
+        """Apply the worker's scan result on the UI thread once it is available"""
+        try:
+            callback, args = self._scan_results.get_nowait()
+        except queue.Empty:
+            self.root.after(_SCAN_POLL_MS, self._poll_scan)
+            return
+        callback(*args)
+    
+    def _apply_scan_results(self, windows: List[GameWindow], stats: dict):
+        """Show the results of a finished window scan"""
+        self.detected_windows = windows
+        
+        # Update display
+        self.window_list.set_windows(windows)
+        
+        # Update statistics
+        self._update_statistics(stats)
+        
+        # Update status
+        if windows:
+            self.status_bar.set_message(f"Found {len(windows)} game windows")
+        else:
+            self.status_bar.set_message("No Dofus/Wakfu windows detected - make sure games are running")
+        
+        self._finish_scan()
+    
+    def _apply_scan_error(self, error: Exception):
+        """Report a failed window scan"""
+        self.status_bar.set_message(f"Error scanning windows: {error}")
+        messagebox.showerror("Error", f"Failed to scan for game windows:\n{error}")
+        self._finish_scan()
+    
+    def _finish_scan(self):
+        """Mark the scan done and start the rerun requested while it was running"""
+        self._scan_running = False
+        if self._rescan_requested:
+            self._rescan_requested = False
+            self.refresh_windows()
     
-    def _update_statistics(self):
+    def _update_statistics(self, stats: dict):
         """Update the statistics display"""
         if not self.detected_windows:
             self.stats_label.config(text="")
             return
         
-        stats = self.detector.get_game_statistics()
         stats_text = f"Total: {stats['total_windows']} | "
         stats_text += f"Dofus: {stats['dofus_windows']} | "
         stats_text += f"Wakfu: {stats['wakfu_windows']} | "
@@ -344,7 +392,7 @@ class WindowCyclerApp:
         """Handle window removal event"""
         self.status_bar.set_message(f"Removed invalid window: {window.get_display_name()}")
         # Refresh window list to reflect changes
-        threading.Timer(1.0, self.refresh_windows).start()
+        self.root.after(1000, self.refresh_windows)
     
     def _on_cycling_stopped(self):
         """Handle cycling stopped event"""
@@ -222,8 +222,8 @@ class ProfileManagerDialog:
         for item in self.profile_tree.get_children():
             self.profile_tree.delete(item)
         
-        # Load profiles
-        profiles_data = self.config_manager.load_profiles()
+        # Load profiles (each entry is validated below as it is displayed)
+        profiles_data = self.config_manager.load_profiles_raw()
         
         # Add profiles to tree
         for name, profile_data in profiles_data.items():
@@ -262,10 +262,9 @@ class ProfileManagerDialog:
         try:
             # Load full profile data
             name = profile_data[0]
-            profiles = self.config_manager.load_profiles()
+            profile = self.config_manager.load_profile(name)
             
-            if name in profiles:
-                profile = Profile.from_dict(profiles[name])
+            if profile:
                 self._show_profile_details(profile)
         except Exception as e:
             print(f"Error showing profile details: {e}")
@@ -6,6 +6,7 @@ Advanced window cycling tool specifically designed for Dofus and Wakfu games
 
 import sys
 import os
+import logging
 from pathlib import Path
 
 # Add project root to Python path
@@ -18,6 +19,9 @@ from gui.main_window import WindowCyclerApp
 
 def main():
     """Main application entry point"""
+    # Route module loggers to the console with the same look as print()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     try:
         print("🎮 Starting Dofus/Wakfu Window Cycler...")
         
@@ -5,9 +5,13 @@ Game window data models and related utilities
 from dataclasses import dataclass, asdict
 from typing import Optional, Dict, Any
 from pathlib import Path
+import sys
 
+# __slots__ for compact instances and faster attribute access (dataclass option needs 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class GameWindow:
     """Represents a game window with all its properties"""
     hwnd: int
@@ -55,7 +59,4 @@ class GameWindow:
         return f"{self.game_type.title()}: {self.get_display_name()}"
     
     def __repr__(self) -> str:
-        return f"GameWindow(hwnd={self.hwnd}, game_type='{self.game_type}', character='{self.character_name}')"
-
-
-import sys
\ No newline at end of file
+        return f"GameWindow(hwnd={self.hwnd}, game_type='{self.game_type}', character='{self.character_name}')"
\ No newline at end of file
@@ -3,6 +3,7 @@ Hotkey configuration models and utilities
 """
 
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import List, Set, Optional, Tuple
 from enum import Enum
 
@@ -22,18 +23,19 @@ class ModifierKey(Enum):
     WIN = "win"
 
 
-@dataclass
+@dataclass(frozen=True)
 class HotkeyConfig:
-    """Configuration for a hotkey"""
+    """Configuration for a hotkey (immutable, so parsed instances can be shared)"""
     raw_value: str  # e.g., "ctrl+mouse5"
     display_name: str  # e.g., "Ctrl+Mouse 5"
-    modifiers: List[ModifierKey]
+    modifiers: Tuple[ModifierKey, ...]
     main_key: str
     hotkey_type: HotkeyType
     
     @classmethod
+    @lru_cache(maxsize=256)
     def parse(cls, hotkey_string: str) -> 'HotkeyConfig':
-        """Parse a hotkey string into a HotkeyConfig"""
+        """Parse a hotkey string into a HotkeyConfig (memoized per string)"""
         raw_value = hotkey_string.lower().strip()
         parts = raw_value.split('+')
         
@@ -61,7 +63,7 @@ class HotkeyConfig:
         return cls(
             raw_value=raw_value,
             display_name=display_name,
-            modifiers=modifiers,
+            modifiers=tuple(modifiers),
             main_key=main_key,
             hotkey_type=hotkey_type
         )
@@ -100,6 +102,11 @@ class HotkeyConfig:
         
         return "+".join(display_parts)
     
+    @cached_property
+    def modifier_names(self) -> str:
+        """Comma-separated modifier names for display, e.g. 'Ctrl, Alt'"""
+        return ', '.join(m.value.title() for m in self.modifiers)
+    
     def is_valid(self) -> bool:
         """Check if this hotkey configuration is valid"""
         try:
@@ -145,8 +152,9 @@ class HotkeyValidator:
     }
     
     @classmethod
+    @lru_cache(maxsize=256)
     def validate_hotkey(cls, hotkey_string: str) -> bool:
-        """Validate a hotkey string"""
+        """Validate a hotkey string (memoized per string)"""
         if not hotkey_string or not hotkey_string.strip():
             return False
         
@@ -173,8 +181,9 @@ class HotkeyValidator:
         return True
     
     @classmethod
+    @lru_cache(maxsize=256)
     def get_validation_error(cls, hotkey_string: str) -> Optional[str]:
-        """Get a descriptive validation error message"""
+        """Get a descriptive validation error message (memoized per string)"""
         if not hotkey_string or not hotkey_string.strip():
             return "Hotkey cannot be empty"
         
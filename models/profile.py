@@ -53,6 +53,9 @@ class Profile:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Profile':
         """Create from dictionary"""
+        # Work on a copy so cached/shared dictionaries are never mutated
+        data = dict(data)
+        
         # Convert window dictionaries to WindowProfile objects
         if 'windows' in data:
             data['windows'] = [WindowProfile.from_dict(w) if isinstance(w, dict) else w 
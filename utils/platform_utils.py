@@ -4,7 +4,8 @@ Platform-specific utilities and compatibility checks
 
 import sys
 import os
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Set
 
 
 def check_platform_requirements() -> bool:
@@ -54,8 +55,9 @@ def check_dependencies() -> List[str]:
     return missing_deps
 
 
+@lru_cache(maxsize=1)
 def get_app_data_dir() -> str:
-    """Get the application data directory"""
+    """Get the application data directory (resolved and created once per process)"""
     if sys.platform == "win32":
         app_data = os.path.expanduser("~/.dofus_wakfu_cycler")
     else:
@@ -159,6 +161,23 @@ class WindowsAPI:
         except:
             return False
     
+    def get_visible_window_handles(self) -> Optional[Set[int]]:
+        """Get the handles of all visible top-level windows in one enumeration (None on failure)"""
+        handles = set()
+        is_visible = self.win32gui.IsWindowVisible
+        
+        def collect(hwnd, _):
+            if is_visible(hwnd):
+                handles.add(hwnd)
+            return True
+        
+        try:
+            self.win32gui.EnumWindows(collect, None)
+        except:
+            # An empty set would read as "no window is alive"; let callers check each one
+            return None
+        return handles
+    
     def is_window_valid(self, hwnd: int) -> bool:
         """Check if window handle is valid"""
         try: